@@ -4,10 +4,12 @@ Provides detailed breakdowns of unmapped hours for reporting purposes.
 """
 
 import logging
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import List, Dict, Tuple, Optional
 from collections import defaultdict
+from functools import lru_cache
 
 from src.models.data_models import (
     FacilityHours,
@@ -15,15 +17,20 @@ from src.models.data_models import (
     UnmappedCategorySummary
 )
 from src.utils.role_display_mapper import get_standard_display_name
+from src.utils.date_calculator import to_timestamp
 from config.constants import FileColumns
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=512)
 def is_unmapped_role(role) -> bool:
     """
     Check if a role is an unmapped category.
     
+    Results are memoized: role columns repeat a few dozen distinct names
+    across many rows, so each distinct name is classified only once.
+    
     Args:
         role: Role name to check (can be string or NaN)
         
@@ -39,6 +46,31 @@ def is_unmapped_role(role) -> bool:
     return any(keyword in role_lower for keyword in unmapped_keywords)
 
 
+def is_unmapped_role_vec(roles: pd.Series) -> pd.Series:
+    """
+    Vectorized form of is_unmapped_role over a Series of role names.
+    
+    Args:
+        roles: Series of role names (non-string values are treated as mapped)
+        
+    Returns:
+        pd.Series: Boolean mask aligned with roles, True where the role is unmapped
+    """
+    # Reason: role columns have few distinct values, so classify each distinct
+    # role once (via the cached scalar check) and broadcast through the integer
+    # codes. Categorical columns reuse their existing categories and codes.
+    if isinstance(roles.dtype, pd.CategoricalDtype):
+        codes = roles.cat.codes.to_numpy()
+        uniques = roles.cat.categories
+    else:
+        codes, uniques = pd.factorize(roles)
+    
+    # Append a False slot so missing values (code -1) index to "not unmapped"
+    unique_mask = np.fromiter((is_unmapped_role(role) for role in uniques), dtype=bool, count=len(uniques))
+    unique_mask = np.append(unique_mask, False)
+    return pd.Series(unique_mask[codes], index=roles.index, name=roles.name)
+
+
 def extract_unmapped_hours_data(
     facility_data: pd.DataFrame, 
     facility: str,
@@ -59,19 +91,35 @@ def extract_unmapped_hours_data(
     """
     logger.debug(f"Extracting unmapped hours for facility '{facility}' from {analysis_start_date} to {analysis_end_date}")
     
-    # Filter for facility and date range
-    facility_filtered = facility_data[
-        (facility_data[FileColumns.FACILITY_LOCATION_NAME] == facility) &
-        (facility_data[FileColumns.FACILITY_HOURS_DATE] >= analysis_start_date) &
-        (facility_data[FileColumns.FACILITY_HOURS_DATE] <= analysis_end_date)
-    ].copy()
+    # Reason: compare the datetime64 column against Timestamps so pandas does not
+    # convert Python datetime bounds on every comparison.
+    start_ts = to_timestamp(analysis_start_date)
+    end_ts = to_timestamp(analysis_end_date)
+    
+    dates = facility_data[FileColumns.FACILITY_HOURS_DATE]
+    if dates.is_monotonic_increasing:
+        # Reason: data sorted by date (as loaded per facility and period) lets a
+        # binary search slice the period, so only that slice is scanned below.
+        lo = dates.searchsorted(start_ts, side='left')
+        hi = dates.searchsorted(end_ts, side='right')
+        period_data = facility_data.iloc[lo:hi]
+        facility_filtered = period_data[
+            period_data[FileColumns.FACILITY_LOCATION_NAME] == facility
+        ].copy()
+    else:
+        # Filter for facility and date range
+        facility_filtered = facility_data[
+            (facility_data[FileColumns.FACILITY_LOCATION_NAME] == facility) &
+            (dates >= start_ts) &
+            (dates <= end_ts)
+        ].copy()
     
     if facility_filtered.empty:
         logger.warning(f"No data found for facility '{facility}' in specified date range")
         return pd.DataFrame()
     
     # Filter for unmapped roles
-    unmapped_mask = facility_filtered[FileColumns.FACILITY_STAFF_ROLE_NAME].apply(is_unmapped_role)
+    unmapped_mask = is_unmapped_role_vec(facility_filtered[FileColumns.FACILITY_STAFF_ROLE_NAME])
     unmapped_data = facility_filtered[unmapped_mask].copy()
     
     logger.info(f"Found {len(unmapped_data)} unmapped hours records for facility '{facility}'")
@@ -79,6 +127,82 @@ def extract_unmapped_hours_data(
     return unmapped_data
 
 
+def _group_unmapped_hours(unmapped_data: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Group unmapped hours by category and employee in a single pass.
+    
+    Args:
+        unmapped_data: Non-empty DataFrame containing unmapped hours data
+        
+    Returns:
+        Tuple containing:
+        - pd.DataFrame: Hours per (category, employee ID, employee name) with a
+          percentage_of_category column
+        - pd.Series: Total hours per category, indexed by category
+    """
+    role_col = FileColumns.FACILITY_STAFF_ROLE_NAME
+    hours_col = FileColumns.FACILITY_TOTAL_HOURS
+    
+    # Group by role (category), employee ID, and employee name
+    grouped = unmapped_data.groupby(
+        [role_col, FileColumns.FACILITY_EMPLOYEE_ID, FileColumns.FACILITY_EMPLOYEE_NAME],
+        observed=True
+    )[hours_col].sum().reset_index()
+    
+    # Reason: category totals come from the raw rows, not the detail frame:
+    # groupby drops rows with a missing employee ID or name, but their hours
+    # still count toward the category the percentages are taken of.
+    category_totals = unmapped_data.groupby(role_col, observed=True)[hours_col].sum()
+    
+    # Reason: compute every percentage in one vectorized step instead of per row;
+    # categories with a zero total get 0% rather than a division by zero.
+    grouped_category_totals = grouped[role_col].map(category_totals).astype(float)
+    grouped['percentage_of_category'] = (
+        grouped[hours_col] / grouped_category_totals * 100
+    ).where(grouped_category_totals > 0, 0.0)
+    
+    return grouped, category_totals
+
+
+def _build_unmapped_results(
+    grouped: pd.DataFrame,
+    facility: str,
+    analysis_start_date: datetime,
+    analysis_end_date: datetime
+) -> List[UnmappedHoursResult]:
+    """
+    Convert the grouped detail frame into sorted UnmappedHoursResult objects.
+    
+    Args:
+        grouped: Detail frame produced by _group_unmapped_hours
+        facility: Name of facility
+        analysis_start_date: Start of analysis period
+        analysis_end_date: End of analysis period
+        
+    Returns:
+        List[UnmappedHoursResult]: Results sorted by category, then hours descending
+    """
+    results = [
+        UnmappedHoursResult(
+            facility=facility,
+            category=category,
+            employee_name=employee_name,
+            employee_id=str(employee_id),
+            total_hours=float(total_hours),
+            percentage_of_category=float(percentage_of_category),
+            analysis_period_start=analysis_start_date,
+            analysis_period_end=analysis_end_date
+        )
+        for category, employee_id, employee_name, total_hours, percentage_of_category
+        in grouped.itertuples(index=False, name=None)
+    ]
+    
+    # Sort by category, then by hours descending
+    results.sort(key=lambda x: (x.category, -x.total_hours))
+    
+    return results
+
+
 def aggregate_unmapped_by_category_and_employee(
     unmapped_data: pd.DataFrame,
     facility: str,
@@ -103,47 +227,76 @@ def aggregate_unmapped_by_category_and_employee(
     
     logger.debug(f"Aggregating unmapped hours by category and employee for facility '{facility}'")
     
-    # Group by role (category), employee ID, and employee name
-    grouped = unmapped_data.groupby([
-        FileColumns.FACILITY_STAFF_ROLE_NAME, 
-        FileColumns.FACILITY_EMPLOYEE_ID, 
-        FileColumns.FACILITY_EMPLOYEE_NAME
-    ])[FileColumns.FACILITY_TOTAL_HOURS].sum().reset_index()
-    
-    # Calculate category totals for percentage calculations
-    category_totals = unmapped_data.groupby(FileColumns.FACILITY_STAFF_ROLE_NAME)[FileColumns.FACILITY_TOTAL_HOURS].sum().to_dict()
-    
-    results = []
-    
-    for _, row in grouped.iterrows():
-        category = row[FileColumns.FACILITY_STAFF_ROLE_NAME]
-        employee_id = str(row[FileColumns.FACILITY_EMPLOYEE_ID])
-        employee_name = row[FileColumns.FACILITY_EMPLOYEE_NAME]
-        total_hours = float(row[FileColumns.FACILITY_TOTAL_HOURS])
-        
-        # Calculate percentage of this category's total
-        category_total = category_totals.get(category, 0)
-        percentage_of_category = (total_hours / category_total * 100) if category_total > 0 else 0
+    grouped, category_totals = _group_unmapped_hours(unmapped_data)
+    results = _build_unmapped_results(grouped, facility, analysis_start_date, analysis_end_date)
+    
+    logger.info(f"Aggregated {len(results)} unmapped hours entries across {len(category_totals)} categories")
+    
+    return results
+
+
+def _build_unmapped_summaries(
+    unmapped_results: List[UnmappedHoursResult],
+    facility: str,
+    analysis_start_date: datetime,
+    analysis_end_date: datetime
+) -> List[UnmappedCategorySummary]:
+    """
+    Build category summaries from non-empty, sorted per-employee results.
+    
+    Args:
+        unmapped_results: Results as returned by _build_unmapped_results
+        facility: Name of facility
+        analysis_start_date: Start of analysis period
+        analysis_end_date: End of analysis period
         
-        result = UnmappedHoursResult(
+    Returns:
+        List[UnmappedCategorySummary]: Summary statistics sorted by total hours descending
+    """
+    role_col = FileColumns.FACILITY_STAFF_ROLE_NAME
+    hours_col = FileColumns.FACILITY_TOTAL_HOURS
+    
+    # Reason: aggregate the hours exactly as stored on the results (already
+    # rounded by the model) so every summary adds up to its detail rows. Each
+    # result is one employee, so employee_count is the row count per category.
+    detail = pd.DataFrame(
+        [(result.category, result.total_hours) for result in unmapped_results],
+        columns=[role_col, hours_col]
+    )
+    # Reason: sum in result order with Python's sum rather than pandas'
+    # compensated sum; the last-bit difference decides half-cent rounding of
+    # the average. sort=False keeps categories in first-seen order before the
+    # final stable sort.
+    by_category = detail.groupby(role_col, observed=True, sort=False)[hours_col]
+    category_totals = by_category.agg(lambda hours: sum(hours.tolist()))
+    employee_counts = by_category.size()
+    
+    total_unmapped_hours = sum(detail[hours_col].tolist())
+    if total_unmapped_hours > 0:
+        percentages = category_totals / total_unmapped_hours * 100
+    else:
+        percentages = pd.Series(0.0, index=category_totals.index)
+    averages = (category_totals / employee_counts).where(employee_counts > 0, 0.0)
+    
+    summaries = [
+        UnmappedCategorySummary(
             facility=facility,
             category=category,
-            employee_name=employee_name,
-            employee_id=employee_id,
-            total_hours=total_hours,
-            percentage_of_category=percentage_of_category,
+            total_hours=float(total_hours),
+            employee_count=int(employee_count),
+            percentage_of_total_unmapped=float(percentage),
+            average_hours_per_employee=float(average),
             analysis_period_start=analysis_start_date,
             analysis_period_end=analysis_end_date
         )
-        
-        results.append(result)
-    
-    # Sort by category, then by hours descending
-    results.sort(key=lambda x: (x.category, -x.total_hours))
+        for category, total_hours, employee_count, percentage, average
+        in zip(category_totals.index, category_totals, employee_counts, percentages, averages)
+    ]
     
-    logger.info(f"Aggregated {len(results)} unmapped hours entries across {len(category_totals)} categories")
+    # Sort by total hours descending
+    summaries.sort(key=lambda x: -x.total_hours)
     
-    return results
+    return summaries
 
 
 def calculate_unmapped_summary_stats(
@@ -170,37 +323,9 @@ def calculate_unmapped_summary_stats(
     
     logger.debug(f"Calculating summary statistics for unmapped categories in facility '{facility}'")
     
-    # Group results by category
-    category_data = defaultdict(list)
-    for result in unmapped_results:
-        category_data[result.category].append(result)
-    
-    # Calculate total unmapped hours across all categories
-    total_unmapped_hours = sum(result.total_hours for result in unmapped_results)
-    
-    summaries = []
-    
-    for category, results in category_data.items():
-        category_total_hours = sum(result.total_hours for result in results)
-        employee_count = len(results)
-        percentage_of_total_unmapped = (category_total_hours / total_unmapped_hours * 100) if total_unmapped_hours > 0 else 0
-        average_hours_per_employee = category_total_hours / employee_count if employee_count > 0 else 0
-        
-        summary = UnmappedCategorySummary(
-            facility=facility,
-            category=category,
-            total_hours=category_total_hours,
-            employee_count=employee_count,
-            percentage_of_total_unmapped=percentage_of_total_unmapped,
-            average_hours_per_employee=average_hours_per_employee,
-            analysis_period_start=analysis_start_date,
-            analysis_period_end=analysis_end_date
-        )
-        
-        summaries.append(summary)
-    
-    # Sort by total hours descending
-    summaries.sort(key=lambda x: -x.total_hours)
+    summaries = _build_unmapped_summaries(
+        unmapped_results, facility, analysis_start_date, analysis_end_date
+    )
     
     logger.info(f"Generated summary statistics for {len(summaries)} unmapped categories")
     
@@ -235,13 +360,17 @@ def analyze_unmapped_hours_for_facility(
             facility_data, facility, analysis_start_date, analysis_end_date
         )
         
-        # Aggregate by category and employee
-        unmapped_results = aggregate_unmapped_by_category_and_employee(
-            unmapped_data, facility, analysis_start_date, analysis_end_date
-        )
+        if unmapped_data.empty:
+            logger.info(f"No unmapped hours data to aggregate for facility '{facility}'")
+            return [], []
         
-        # Calculate summary statistics
-        category_summaries = calculate_unmapped_summary_stats(
+        # Reason: the raw rows are grouped once; the summaries are built from the
+        # resulting objects so their totals match the rounded detail rows.
+        grouped, _ = _group_unmapped_hours(unmapped_data)
+        unmapped_results = _build_unmapped_results(
+            grouped, facility, analysis_start_date, analysis_end_date
+        )
+        category_summaries = _build_unmapped_summaries(
             unmapped_results, facility, analysis_start_date, analysis_end_date
         )
         
@@ -229,6 +229,11 @@ class UnmappedHoursResult(BaseModel):
     @validator('total_hours', 'percentage_of_category')
     def round_values(cls, v):
         return round(v, 2)
+    
+    class Config:
+        # Reason: results are built in bulk and only read afterwards; freezing
+        # them (frozen also makes them hashable) guards against accidental edits.
+        frozen = True
 
 
 class UnmappedCategorySummary(BaseModel):
@@ -246,6 +251,9 @@ class UnmappedCategorySummary(BaseModel):
     @validator('total_hours', 'percentage_of_total_unmapped', 'average_hours_per_employee')
     def round_values(cls, v):
         return round(v, 2)
+    
+    class Config:
+        frozen = True  # Read-only once computed, like UnmappedHoursResult
 
 
 class DataQualitySummary(BaseModel):
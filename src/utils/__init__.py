@@ -5,7 +5,7 @@ This package contains cross-cutting utility modules that provide common function
 across different components of the workforce analytics system.
 """
 
-from .date_calculator import calculate_analysis_date_range, validate_date_range
+from .date_calculator import calculate_analysis_date_range, validate_date_range, to_timestamp
 from .weekday_converter import (
     model_to_python_weekday,
     python_weekday_to_model,
@@ -25,6 +25,7 @@ __all__ = [
     # Date calculation
     "calculate_analysis_date_range",
     "validate_date_range",
+    "to_timestamp",
     # Weekday conversion
     "model_to_python_weekday",
     "python_weekday_to_model",
@@ -0,0 +1,176 @@
+"""
+Lookup-table backend for weekday_converter.
+
+Builds the tuple tables used by the scalar converters and the int8 tables used
+for bulk conversions, and gathers integer arrays through them with NumPy or,
+for large arrays, an optional numba kernel. numba is not a required
+dependency: when it is not installed, get_numba_gather returns None and
+gather_weekdays uses NumPy fancy indexing.
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+import logging
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+# Arrays at least this long use the numba kernel when numba is installed; below
+# it the JIT dispatch cost outweighs the gain over NumPy fancy indexing.
+NUMBA_MIN_SIZE = 4096
+
+_numba_gather = None
+_numba_checked = False
+
+
+def as_table(mapping: Dict[int, int]) -> Tuple[Optional[int], ...]:
+    """
+    Flatten a day-number mapping into a tuple indexed by the source day.
+
+    Args:
+        mapping: Conversion mapping with non-negative integer keys
+
+    Returns:
+        Tuple where table[day] is the converted day, or None for unused slots
+    """
+    return tuple(mapping.get(day) for day in range(max(mapping) + 1))
+
+
+class WeekdayLUTs(NamedTuple):
+    """Immutable set of tuple lookup tables, one per scalar conversion."""
+    model_to_py: Tuple[Optional[int], ...]
+    py_to_model: Tuple[Optional[int], ...]
+    model_to_sf: Tuple[Optional[int], ...]
+    sf_to_model: Tuple[Optional[int], ...]
+    py_to_sf: Tuple[Optional[int], ...]
+    sf_to_py: Tuple[Optional[int], ...]
+
+
+def build_weekday_luts(
+    model_to_py: Dict[int, int],
+    py_to_model: Dict[int, int],
+    model_to_sf: Dict[int, int],
+    sf_to_model: Dict[int, int]
+) -> WeekdayLUTs:
+    """
+    Build every scalar lookup table from the four public conversion mappings.
+
+    Args:
+        model_to_py: Model (Sunday=1) to Python weekday mapping
+        py_to_model: Python weekday to model mapping
+        model_to_sf: Model to Sunday-first mapping
+        sf_to_model: Sunday-first to model mapping
+
+    Returns:
+        WeekdayLUTs: Tuple tables; the Python <-> Sunday-first tables are
+        composed through the model format
+    """
+    return WeekdayLUTs(
+        model_to_py=as_table(model_to_py),
+        py_to_model=as_table(py_to_model),
+        model_to_sf=as_table(model_to_sf),
+        sf_to_model=as_table(sf_to_model),
+        py_to_sf=tuple(model_to_sf[py_to_model[day]] for day in range(7)),
+        sf_to_py=tuple(model_to_py[sf_to_model[day]] for day in range(7)),
+    )
+
+
+def as_lut(table: Tuple[Optional[int], ...]) -> np.ndarray:
+    """
+    Convert a tuple lookup table to a read-only int8 array, marking unused slots with -1.
+
+    Args:
+        table: Tuple lookup table (None for unused slots)
+
+    Returns:
+        np.ndarray: int8 lookup array
+    """
+    lut = np.array([-1 if day is None else day for day in table], dtype=np.int8)
+    lut.flags.writeable = False
+    return lut
+
+
+def gather_through_sunday_first(src, to_sf, from_sf, out) -> bool:
+    """
+    Convert src through the Sunday-first tables into out, element by element.
+
+    Plain Python so it can be compiled by numba.njit; too slow to call directly.
+
+    Args:
+        src: 1-D integer array of source day numbers
+        to_sf: int8 table from the source format to Sunday-first (-1 = invalid)
+        from_sf: int8 table from Sunday-first to the target format
+        out: int8 output array, same length as src
+
+    Returns:
+        bool: True if every day was valid, False at the first invalid day
+    """
+    n_slots = to_sf.shape[0]
+    for i in range(src.shape[0]):
+        day = src[i]
+        if day < 0 or day >= n_slots:
+            return False
+        sunday_first = to_sf[day]
+        if sunday_first < 0:
+            return False
+        out[i] = from_sf[sunday_first]
+    return True
+
+
+def get_numba_gather():
+    """
+    Compile the numba gather kernel on first use.
+
+    Returns:
+        The jitted kernel, or None if numba is not installed
+    """
+    global _numba_gather, _numba_checked
+
+    # Reason: import numba lazily so callers that never convert large arrays
+    # do not pay its import cost; the outcome is remembered either way.
+    if not _numba_checked:
+        _numba_checked = True
+        try:
+            from numba import njit
+            _numba_gather = njit(cache=True)(gather_through_sunday_first)
+        except ImportError:
+            logger.debug("numba not available - large weekday conversions will use NumPy")
+
+    return _numba_gather
+
+
+def gather_weekdays(arr: np.ndarray, to_sf: np.ndarray, from_sf: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Convert a 1-D integer array of days through the Sunday-first tables.
+
+    Args:
+        arr: 1-D integer array of source day numbers
+        to_sf: Table from the source format to Sunday-first
+        from_sf: Table from Sunday-first to the target format
+
+    Returns:
+        np.ndarray of converted days, or None if any day is invalid
+    """
+    # Reason: the unsigned view below reinterprets raw bytes, so byte-swapped
+    # input (e.g. '>i4') must be in native order first (no copy if it already is)
+    arr = arr.astype(arr.dtype.newbyteorder('='), copy=False)
+
+    if arr.size >= NUMBA_MIN_SIZE:
+        kernel = get_numba_gather()
+        if kernel is not None:
+            out = np.empty(arr.size, dtype=np.int8)
+            return out if kernel(arr, to_sf, from_sf, out) else None
+
+    # Reason: gather the whole array through the NumPy tables in C-level index
+    # operations; -1 marks slots that are not valid source days and must be
+    # caught before the second gather, where it would wrap around.
+    # Viewed as unsigned, negative days wrap to huge values, so one comparison
+    # bounds-checks both ends of the table.
+    if not (arr.view(np.dtype(f"u{arr.itemsize}")) < len(to_sf)).all():
+        return None
+    sunday_first = to_sf[arr]
+    if not (sunday_first >= 0).all():
+        return None
+    return from_sf[sunday_first]
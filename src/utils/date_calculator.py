@@ -3,9 +3,10 @@ Date range calculation utilities for workforce analytics.
 Implements F-0 control variables for dynamic date range determination.
 """
 
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Tuple, Optional
+from typing import Callable, Tuple, Optional, Union
 import logging
 
 from config.constants import DATE_FORMAT, DayOfWeek
@@ -14,12 +15,38 @@ from config.settings import ControlVariables
 
 logger = logging.getLogger(__name__)
 
+_NS_PER_DAY = 86_400_000_000_000
+
+
+def to_timestamp(value: Union[datetime, str, pd.Timestamp]) -> pd.Timestamp:
+    """
+    Normalize a datetime, YYYY-MM-DD string or Timestamp to a pd.Timestamp.
+    
+    Args:
+        value: Date to normalize
+        
+    Returns:
+        pd.Timestamp: The same instant as a pandas Timestamp
+        
+    Raises:
+        ValueError: If a string value is not in YYYY-MM-DD format
+    """
+    if isinstance(value, pd.Timestamp):
+        return value
+    if isinstance(value, str):
+        # Reason: keep the strict YYYY-MM-DD format required for date overrides
+        return pd.Timestamp(datetime.strptime(value, "%Y-%m-%d"))
+    return pd.Timestamp(value)
+
 
 def calculate_analysis_date_range(
     facility_df: pd.DataFrame,
     control_variables: ControlVariables,
     start_date_override: Optional[str] = None,
-    end_date_override: Optional[str] = None
+    end_date_override: Optional[str] = None,
+    *,
+    now: Callable[[], datetime] = datetime.now,
+    weekday_col: Optional[str] = None
 ) -> Tuple[datetime, datetime]:
     """
     Calculate analysis date range using F-0 control variables and override logic.
@@ -36,17 +63,20 @@ def calculate_analysis_date_range(
         control_variables: F-0 control variables
         start_date_override: Optional start date override (YYYY-MM-DD format)
         end_date_override: Optional end date override (YYYY-MM-DD format)
+        now: Clock used when no data is available (injectable for tests)
+        weekday_col: Optional precomputed Python weekday column (Monday=0) used by
+            the new data day logic instead of deriving weekdays from the dates
         
     Returns:
-        Tuple of (analysis_start_date, analysis_end_date)
+        Tuple of (analysis_start_date, analysis_end_date) as pd.Timestamp values
     """
     logger.info("Calculating analysis date range")
     
     # Priority 1: Command line/function parameters (highest priority)
     if start_date_override and end_date_override:
         logger.info("Using command line date overrides")
-        start_date = datetime.strptime(start_date_override, "%Y-%m-%d")
-        end_date = datetime.strptime(end_date_override, "%Y-%m-%d")
+        start_date = to_timestamp(start_date_override)
+        end_date = to_timestamp(end_date_override)
         return start_date, end_date
     
     # Priority 2: Dynamic calculation using control variables (production default)
@@ -54,7 +84,7 @@ def calculate_analysis_date_range(
     
     if facility_df.empty:
         logger.warning("Empty facility data - using current date")
-        current_date = datetime.now()
+        current_date = to_timestamp(now())
         return current_date, current_date
     
     # Get the date column name
@@ -63,7 +93,7 @@ def calculate_analysis_date_range(
     
     if date_col not in facility_df.columns:
         logger.error(f"Date column '{date_col}' not found in facility data")
-        current_date = datetime.now()
+        current_date = to_timestamp(now())
         return current_date, current_date
     
     # Get the most recent date in the data
@@ -74,7 +104,7 @@ def calculate_analysis_date_range(
     if control_variables.use_data_day:
         # F-0c & F-0d: Use new data day logic
         period_end_date = _find_most_recent_data_day(
-            facility_df, date_col, control_variables.new_data_day
+            facility_df, date_col, control_variables.new_data_day, weekday_col=weekday_col
         )
         logger.info(f"Using new data day logic - period end: {period_end_date.strftime(DATE_FORMAT)}")
     else:
@@ -94,7 +124,27 @@ def calculate_analysis_date_range(
     return analysis_start_date, analysis_end_date
 
 
-def _find_most_recent_data_day(facility_df: pd.DataFrame, date_col: str, target_day: int) -> datetime:
+def _as_column_timestamp(value: np.datetime64, tz) -> pd.Timestamp:
+    """
+    Wrap a NumPy datetime from a date column back into a pd.Timestamp.
+    
+    Args:
+        value: datetime64 value (a UTC instant when the column is tz-aware)
+        tz: Time zone of the source column, or None for naive columns
+        
+    Returns:
+        pd.Timestamp in the column's time zone
+    """
+    timestamp = pd.Timestamp(value)
+    return timestamp if tz is None else timestamp.tz_localize('UTC').tz_convert(tz)
+
+
+def _find_most_recent_data_day(
+    facility_df: pd.DataFrame,
+    date_col: str,
+    target_day: int,
+    weekday_col: Optional[str] = None
+) -> datetime:
     """
     Find the most recent date that falls on the specified day of week.
     
@@ -102,6 +152,8 @@ def _find_most_recent_data_day(facility_df: pd.DataFrame, date_col: str, target_
         facility_df: DataFrame with facility data
         date_col: Name of date column
         target_day: Target day of week (1=Sunday, 2=Monday, etc.)
+        weekday_col: Optional column of precomputed Python weekdays (Monday=0);
+            when given, weekdays are read from it instead of derived from dates
         
     Returns:
         Most recent date matching the target day
@@ -115,16 +167,27 @@ def _find_most_recent_data_day(facility_df: pd.DataFrame, date_col: str, target_
     else:
         python_target_day = target_day - 2
     
-    # Filter dates that match the target day of week
-    matching_dates = facility_df[
-        facility_df[date_col].dt.weekday == python_target_day
-    ]
+    # Reason: derive the weekday from raw day counts in NumPy instead of going
+    # through the pandas .dt accessor. 1970-01-01 (day 0) was a Thursday, which
+    # is Python weekday 3, so weekday = (days + 3) % 7.
+    dates_series = facility_df[date_col]
+    tz = getattr(dates_series.dtype, 'tz', None)
+    # Tz-aware columns come out of to_numpy as UTC instants: order by those,
+    # but take weekdays from the local wall-clock values.
+    dates = dates_series.to_numpy(dtype='datetime64[ns]')
+    wall_dates = dates if tz is None else dates_series.dt.tz_localize(None).to_numpy(dtype='datetime64[ns]')
+    valid = ~np.isnat(dates)
+    if weekday_col is not None:
+        weekdays = facility_df[weekday_col].to_numpy()
+    else:
+        weekdays = (wall_dates.astype('datetime64[D]').view('int64') + 3) % 7
+    matching = valid & (weekdays == python_target_day)
     
-    if matching_dates.empty:
+    if not matching.any():
         logger.warning(f"No dates found for target day {target_day}, using most recent date")
-        return facility_df[date_col].max()
+        return _as_column_timestamp(dates[valid].max(), tz) if valid.any() else pd.NaT
     
-    most_recent_matching = matching_dates[date_col].max()
+    most_recent_matching = _as_column_timestamp(dates[matching].max(), tz)
     logger.info(f"Found most recent {DayOfWeek(target_day).name}: {most_recent_matching.strftime(DATE_FORMAT)}")
     
     return most_recent_matching
@@ -140,13 +203,30 @@ def validate_date_range(start_date: datetime, end_date: datetime) -> bool:
         
     Returns:
         True if valid, False otherwise
+        
+    Raises:
+        TypeError: If one bound is tz-aware and the other tz-naive
     """
-    if start_date >= end_date:
+    start_ts = to_timestamp(start_date)
+    end_ts = to_timestamp(end_date)
+    
+    # Reason: .value is UTC-based for tz-aware bounds and wall-clock for naive
+    # ones, so mixing the two would compare unrelated instants. Keep the
+    # TypeError that subtracting the datetimes used to raise.
+    if (start_ts.tzinfo is None) != (end_ts.tzinfo is None):
+        raise TypeError("Cannot compare tz-naive and tz-aware date range bounds")
+    
+    # Reason: compare int64 nanosecond values rather than building a timedelta;
+    # floor division matches timedelta.days for partial days.
+    start_ns = start_ts.value
+    end_ns = end_ts.value
+    
+    if start_ns >= end_ns:
         logger.error(f"Invalid date range: start_date ({start_date.strftime(DATE_FORMAT)}) must be before end_date ({end_date.strftime(DATE_FORMAT)})")
         return False
     
     # Check if range is reasonable (not too long or too short)
-    days_span = (end_date - start_date).days
+    days_span = (end_ns - start_ns) // _NS_PER_DAY
     if days_span < 1:
         logger.error(f"Date range too short: {days_span} days")
         return False
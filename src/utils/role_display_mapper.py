@@ -25,7 +25,8 @@ Example Usage:
 
 import logging
 import pandas as pd
-from typing import Dict, Optional, List, Tuple, Union, Any
+from typing import Dict, Optional, List, NamedTuple, Tuple, Union, Any
+from collections import Counter
 
 from config.constants import RoleDisplayPreference, DEFAULT_ROLE_DISPLAY_PREFERENCES, FileColumns, DISPLAY_UNMAPPED_TERM
 
@@ -353,6 +354,47 @@ ROLE_DISPLAY_MAPPINGS: Dict[str, Dict[str, Union[str, float]]] = {
 }
 
 
+class RoleDisplayNames(NamedTuple):
+    """Immutable pair of display names for a single model role."""
+    standard: str
+    short: str
+
+
+# Frozen view of the display names in ROLE_DISPLAY_MAPPINGS.
+# Reason: display names never change at runtime (only shift hours are updated in
+# place), so hot lookups read tuple fields instead of nested dict keys.
+_ROLE_DISPLAY_NAMES: Dict[str, RoleDisplayNames] = {
+    role: RoleDisplayNames(mappings["standard"], mappings["short"])
+    for role, mappings in ROLE_DISPLAY_MAPPINGS.items()
+}
+
+# Reverse lookup tables built once at import (display name -> model role).
+# Reason: iterate in reverse so the first role in ROLE_DISPLAY_MAPPINGS wins on
+# a duplicate name, matching the original linear-scan semantics.
+_STANDARD_TO_ROLE: Dict[str, str] = {
+    names.standard: role for role, names in reversed(_ROLE_DISPLAY_NAMES.items())
+}
+_SHORT_TO_ROLE: Dict[str, str] = {
+    names.short: role for role, names in reversed(_ROLE_DISPLAY_NAMES.items())
+}
+
+# Sorted listings cached at import; the role set and display names are static
+_ALL_MODEL_ROLES: Tuple[str, ...] = tuple(sorted(_ROLE_DISPLAY_NAMES))
+_ALL_STANDARD_NAMES: Tuple[str, ...] = tuple(sorted(names.standard for names in _ROLE_DISPLAY_NAMES.values()))
+_ALL_SHORT_NAMES: Tuple[str, ...] = tuple(sorted(names.short for names in _ROLE_DISPLAY_NAMES.values()))
+
+# Display names with the unmapped term already replaced, for chart labels.
+# Reason: DISPLAY_UNMAPPED_TERM is a constant, so the replacement is done once
+# here rather than for every mapped role on each format_roles_for_chart call.
+_CHART_DISPLAY_NAMES: Dict[str, RoleDisplayNames] = {
+    role: RoleDisplayNames(
+        _apply_display_term_replacement(names.standard),
+        _apply_display_term_replacement(names.short),
+    )
+    for role, names in _ROLE_DISPLAY_NAMES.items()
+}
+
+
 def get_standard_display_name(model_role: str) -> str:
     """
     Get the standard (full) display name for a model role.
@@ -366,11 +408,11 @@ def get_standard_display_name(model_role: str) -> str:
     Raises:
         KeyError: If model role is not found in mappings
     """
-    if model_role not in ROLE_DISPLAY_MAPPINGS:
+    if model_role not in _ROLE_DISPLAY_NAMES:
         logger.warning(f"Model role '{model_role}' not found in display mappings")
         raise KeyError(f"No display mapping found for model role: '{model_role}'")
     
-    standard_name = ROLE_DISPLAY_MAPPINGS[model_role]["standard"]
+    standard_name = _ROLE_DISPLAY_NAMES[model_role].standard
     return _apply_display_term_replacement(standard_name)
 
 
@@ -387,11 +429,11 @@ def get_short_display_name(model_role: str) -> str:
     Raises:
         KeyError: If model role is not found in mappings
     """
-    if model_role not in ROLE_DISPLAY_MAPPINGS:
+    if model_role not in _ROLE_DISPLAY_NAMES:
         logger.warning(f"Model role '{model_role}' not found in display mappings")
         raise KeyError(f"No display mapping found for model role: '{model_role}'")
     
-    short_name = ROLE_DISPLAY_MAPPINGS[model_role]["short"]
+    short_name = _ROLE_DISPLAY_NAMES[model_role].short
     return _apply_display_term_replacement(short_name)
 
 
@@ -711,12 +753,10 @@ def get_model_role_from_standard_display(display_name: str) -> Optional[str]:
     Returns:
         Model role name if found, None otherwise
     """
-    for model_role, mappings in ROLE_DISPLAY_MAPPINGS.items():
-        if mappings["standard"] == display_name:
-            return model_role
-    
-    logger.warning(f"Standard display name '{display_name}' not found in mappings")
-    return None
+    model_role = _STANDARD_TO_ROLE.get(display_name)
+    if model_role is None:
+        logger.warning(f"Standard display name '{display_name}' not found in mappings")
+    return model_role
 
 
 def get_model_role_from_short_display(display_name: str) -> Optional[str]:
@@ -729,12 +769,10 @@ def get_model_role_from_short_display(display_name: str) -> Optional[str]:
     Returns:
         Model role name if found, None otherwise
     """
-    for model_role, mappings in ROLE_DISPLAY_MAPPINGS.items():
-        if mappings["short"] == display_name:
-            return model_role
-    
-    logger.warning(f"Short display name '{display_name}' not found in mappings")
-    return None
+    model_role = _SHORT_TO_ROLE.get(display_name)
+    if model_role is None:
+        logger.warning(f"Short display name '{display_name}' not found in mappings")
+    return model_role
 
 
 def get_model_role_from_any_display(display_name: str) -> Optional[str]:
@@ -773,7 +811,7 @@ def get_all_model_roles() -> List[str]:
     Returns:
         Sorted list of all model role names
     """
-    return sorted(ROLE_DISPLAY_MAPPINGS.keys())
+    return list(_ALL_MODEL_ROLES)
 
 
 def get_all_standard_display_names() -> List[str]:
@@ -783,7 +821,7 @@ def get_all_standard_display_names() -> List[str]:
     Returns:
         Sorted list of all standard display names
     """
-    return sorted([mapping["standard"] for mapping in ROLE_DISPLAY_MAPPINGS.values()])
+    return list(_ALL_STANDARD_NAMES)
 
 
 def get_all_short_display_names() -> List[str]:
@@ -793,7 +831,7 @@ def get_all_short_display_names() -> List[str]:
     Returns:
         Sorted list of all short display names
     """
-    return sorted([mapping["short"] for mapping in ROLE_DISPLAY_MAPPINGS.values()])
+    return list(_ALL_SHORT_NAMES)
 
 
 def validate_model_roles_coverage(model_roles: List[str]) -> Tuple[bool, List[str]]:
@@ -828,12 +866,12 @@ def validate_unique_display_names() -> Tuple[bool, List[str], List[str]]:
     Returns:
         Tuple of (all_unique: bool, duplicate_standard: List[str], duplicate_short: List[str])
     """
-    standard_names = [mapping["standard"] for mapping in ROLE_DISPLAY_MAPPINGS.values()]
-    short_names = [mapping["short"] for mapping in ROLE_DISPLAY_MAPPINGS.values()]
+    standard_names = [names.standard for names in _ROLE_DISPLAY_NAMES.values()]
+    short_names = [names.short for names in _ROLE_DISPLAY_NAMES.values()]
     
-    # Find duplicates
-    duplicate_standard = [name for name in set(standard_names) if standard_names.count(name) > 1]
-    duplicate_short = [name for name in set(short_names) if short_names.count(name) > 1]
+    # Find duplicates in a single hash-counting pass per name type
+    duplicate_standard = [name for name, count in Counter(standard_names).items() if count > 1]
+    duplicate_short = [name for name, count in Counter(short_names).items() if count > 1]
     
     all_unique = len(duplicate_standard) == 0 and len(duplicate_short) == 0
     
@@ -853,8 +891,8 @@ def get_role_mapping_summary() -> Dict[str, int]:
         Dictionary with mapping statistics
     """
     total_roles = len(ROLE_DISPLAY_MAPPINGS)
-    unique_standard = len(set(mapping["standard"] for mapping in ROLE_DISPLAY_MAPPINGS.values()))
-    unique_short = len(set(mapping["short"] for mapping in ROLE_DISPLAY_MAPPINGS.values()))
+    unique_standard = len(set(names.standard for names in _ROLE_DISPLAY_NAMES.values()))
+    unique_short = len(set(names.short for names in _ROLE_DISPLAY_NAMES.values()))
     
     return {
         "total_model_roles": total_roles,
@@ -898,22 +936,19 @@ def format_roles_for_chart(model_roles: List[str], max_length: Optional[int] = N
     Returns:
         List of formatted role names optimized for chart display
     """
+    # Reason: each input role is a single lookup into the prebuilt chart names
+    # instead of two guarded function calls.
     formatted_roles = []
-    
     for role in model_roles:
-        try:
-            standard_name = get_standard_display_name(role)
-            short_name = get_short_display_name(role)
-            
-            # Choose short name if max_length is specified and standard name is too long
-            if max_length and len(standard_name) > max_length:
-                formatted_roles.append(short_name)
-            else:
-                formatted_roles.append(standard_name)
-                
-        except KeyError:
+        names = _CHART_DISPLAY_NAMES.get(role)
+        if names is None:
             logger.warning(f"Using original role name for unmapped role: '{role}'")
             formatted_roles.append(role)
+        # Choose short name if max_length is specified and standard name is too long
+        elif max_length and len(names.standard) > max_length:
+            formatted_roles.append(names.short)
+        else:
+            formatted_roles.append(names.standard)
     
     return formatted_roles
 
@@ -10,11 +10,14 @@ The module ensures consistent weekday handling across the codebase when dealing
 different data sources and Python's datetime library.
 """
 
-from typing import Union, List, Dict
-from datetime import datetime
+from typing import Union, List, Dict, Optional, Tuple
+from datetime import date as _date, datetime
 import logging
 
+import numpy as np
+
 from config.constants import DayOfWeek
+from src.utils._weekday_lookup import as_lut, build_weekday_luts, gather_weekdays
 
 
 logger = logging.getLogger(__name__)
@@ -62,6 +65,86 @@ SUNDAY_FIRST_TO_MODEL: Dict[int, int] = {
 }
 
 
+# Weekday number formats accepted by the converters. String literals are
+# already interned by CPython, so dict lookups on these keys hit the identity
+# fast path; naming them once keeps every table keyed consistently.
+_FMT_MODEL = "model"
+_FMT_PYTHON = "python"
+_FMT_SUNDAY_FIRST = "sunday_first"
+
+# Error message templates, formatted only on the raise path
+_ERR_MODEL_DAY = "Invalid model day number: {}. Must be 1-7."
+_ERR_PYTHON_DAY = "Invalid Python weekday number: {}. Must be 0-6."
+_ERR_SUNDAY_FIRST_DAY = "Invalid Sunday-first day number: {}. Must be 0-6."
+_ERR_FORMAT_TYPE = "Invalid format_type: {}. Must be 'model', 'python', or 'sunday_first'."
+_ERR_DAY_FOR_FORMAT = "Invalid day number {} for format {}"
+_ERR_FORMAT_COMBINATION = "Invalid format combination: from '{}' to '{}'"
+_ERR_MISSING_DATE = "Cannot get the weekday of a missing date: {}"
+
+
+# Reason: tuple lookup tables turn each scalar conversion into a single index
+# operation instead of a membership test plus a dict lookup. Derived from the
+# public mappings above so they stay the single source of truth, and grouped
+# in one immutable record built in a single pass at import.
+_LUT = build_weekday_luts(
+    MODEL_TO_PYTHON_WEEKDAY, PYTHON_WEEKDAY_TO_MODEL, MODEL_TO_SUNDAY_FIRST, SUNDAY_FIRST_TO_MODEL
+)
+
+# Reason: unpack once into module globals for the hot paths; a global load is
+# cheaper per call than a NamedTuple attribute lookup on _LUT.
+_MODEL_TO_PY, _PY_TO_MODEL, _MODEL_TO_SF, _SF_TO_MODEL, _PY_TO_SF, _SF_TO_PY = _LUT
+
+
+def _integral_day(day) -> Optional[int]:
+    """
+    Coerce an integral non-int day number (e.g. 3.0 from a float64 column) to int.
+    
+    Args:
+        day: Day number that could not be used as a tuple index directly
+        
+    Returns:
+        The day as an int if it equals a whole number, otherwise None
+    """
+    try:
+        index = int(day)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return index if index == day else None
+
+
+def _lookup(table: Tuple[Optional[int], ...], day: int, error_template: str) -> int:
+    """
+    Convert a day number through a lookup table.
+    
+    Args:
+        table: Tuple lookup table from _LUT (None for unused slots)
+        day: Day number to convert; DayOfWeek members index directly as ints,
+            integral floats are accepted as their int value
+        error_template: ValueError message with a {} placeholder for the day
+        
+    Returns:
+        Converted day number
+        
+    Raises:
+        ValueError: If day has no entry in the table
+    """
+    # Reason: negative indexes would wrap around the tuple, so reject them
+    # explicitly; non-int days surface as TypeError from the index and are
+    # retried only if integral, matching the old dict lookups (1.0 == 1).
+    try:
+        converted = table[day] if day >= 0 else None
+    except IndexError:
+        converted = None
+    except TypeError:
+        index = _integral_day(day)
+        converted = table[index] if index is not None and 0 <= index < len(table) else None
+    
+    if converted is None:
+        raise ValueError(error_template.format(day))
+    
+    return converted
+
+
 def model_to_python_weekday(model_day: Union[int, DayOfWeek]) -> int:
     """
     Convert model data weekday (Sunday=1) to Python datetime.weekday() format (Monday=0).
@@ -83,13 +166,7 @@ def model_to_python_weekday(model_day: Union[int, DayOfWeek]) -> int:
         >>> model_to_python_weekday(DayOfWeek.FRIDAY)
         4
     """
-    if isinstance(model_day, DayOfWeek):
-        model_day = model_day.value
-    
-    if model_day not in MODEL_TO_PYTHON_WEEKDAY:
-        raise ValueError(f"Invalid model day number: {model_day}. Must be 1-7.")
-    
-    return MODEL_TO_PYTHON_WEEKDAY[model_day]
+    return _lookup(_MODEL_TO_PY, model_day, _ERR_MODEL_DAY)
 
 
 def python_weekday_to_model(python_day: int) -> int:
@@ -114,10 +191,7 @@ def python_weekday_to_model(python_day: int) -> int:
         >>> python_weekday_to_model(date(2025, 7, 15).weekday())  # Tuesday
         3
     """
-    if python_day not in PYTHON_WEEKDAY_TO_MODEL:
-        raise ValueError(f"Invalid Python weekday number: {python_day}. Must be 0-6.")
-    
-    return PYTHON_WEEKDAY_TO_MODEL[python_day]
+    return _lookup(_PY_TO_MODEL, python_day, _ERR_PYTHON_DAY)
 
 
 def model_to_sunday_first(model_day: Union[int, DayOfWeek]) -> int:
@@ -141,13 +215,7 @@ def model_to_sunday_first(model_day: Union[int, DayOfWeek]) -> int:
         >>> model_to_sunday_first(DayOfWeek.WEDNESDAY)
         3
     """
-    if isinstance(model_day, DayOfWeek):
-        model_day = model_day.value
-    
-    if model_day not in MODEL_TO_SUNDAY_FIRST:
-        raise ValueError(f"Invalid model day number: {model_day}. Must be 1-7.")
-    
-    return MODEL_TO_SUNDAY_FIRST[model_day]
+    return _lookup(_MODEL_TO_SF, model_day, _ERR_MODEL_DAY)
 
 
 def sunday_first_to_model(sunday_day: int) -> int:
@@ -169,10 +237,7 @@ def sunday_first_to_model(sunday_day: int) -> int:
         >>> sunday_first_to_model(6)  # Saturday
         7
     """
-    if sunday_day not in SUNDAY_FIRST_TO_MODEL:
-        raise ValueError(f"Invalid Sunday-first day number: {sunday_day}. Must be 0-6.")
-    
-    return SUNDAY_FIRST_TO_MODEL[sunday_day]
+    return _lookup(_SF_TO_MODEL, sunday_day, _ERR_SUNDAY_FIRST_DAY)
 
 
 def python_weekday_to_sunday_first(python_day: int) -> int:
@@ -191,10 +256,9 @@ def python_weekday_to_sunday_first(python_day: int) -> int:
         >>> python_weekday_to_sunday_first(6)  # Sunday
         0
     """
-    # Reason: Two-step conversion through model format ensures consistency
-    # Python -> Model -> Sunday-first
-    model_day = python_weekday_to_model(python_day)
-    return model_to_sunday_first(model_day)
+    # Reason: py_to_sf is composed from the model-format mappings at import,
+    # so the Python -> Model -> Sunday-first chain is a single lookup here
+    return _lookup(_PY_TO_SF, python_day, _ERR_PYTHON_DAY)
 
 
 def sunday_first_to_python_weekday(sunday_day: int) -> int:
@@ -213,10 +277,23 @@ def sunday_first_to_python_weekday(sunday_day: int) -> int:
         >>> sunday_first_to_python_weekday(1)  # Monday
         0
     """
-    # Reason: Two-step conversion through model format ensures consistency
-    # Sunday-first -> Model -> Python
-    model_day = sunday_first_to_model(sunday_day)
-    return model_to_python_weekday(model_day)
+    # Reason: sf_to_py is composed from the model-format mappings at import,
+    # so the Sunday-first -> Model -> Python chain is a single lookup here
+    return _lookup(_SF_TO_PY, sunday_day, _ERR_SUNDAY_FIRST_DAY)
+
+
+# Weekday names as one flat table: row per format (in _FMT_ID order), slot per
+# day number, so a name is found with a single multiply-add and tuple index.
+# The table holds every valid (format, day) result, so it already is the memo
+# for get_weekday_name; an lru_cache in front of it measured no faster.
+_FMT_ID = {_FMT_MODEL: 0, _FMT_PYTHON: 1, _FMT_SUNDAY_FIRST: 2}
+_NAMES_STRIDE = 8
+_MODEL_DAY_NAMES = {member.value: member.name for member in DayOfWeek}
+_WEEKDAY_NAMES_BY_FORMAT = (
+    tuple(_MODEL_DAY_NAMES.get(day) for day in range(_NAMES_STRIDE))
+    + tuple(_MODEL_DAY_NAMES.get(PYTHON_WEEKDAY_TO_MODEL.get(day)) for day in range(_NAMES_STRIDE))
+    + tuple(_MODEL_DAY_NAMES.get(SUNDAY_FIRST_TO_MODEL.get(day)) for day in range(_NAMES_STRIDE))
+)
 
 
 def get_weekday_name(day: Union[int, DayOfWeek], format_type: str = "model") -> str:
@@ -241,29 +318,58 @@ def get_weekday_name(day: Union[int, DayOfWeek], format_type: str = "model") ->
         >>> get_weekday_name(0, "sunday_first")
         'SUNDAY'
     """
-    # Convert to model format first for consistency
-    if format_type == "model":
-        model_day = day
-    elif format_type == "python":
-        model_day = python_weekday_to_model(day)
-    elif format_type == "sunday_first":
-        model_day = sunday_first_to_model(day)
-    else:
-        raise ValueError(f"Invalid format_type: {format_type}. Must be 'model', 'python', or 'sunday_first'.")
+    fmt_id = _FMT_ID.get(format_type)
+    if fmt_id is None:
+        raise ValueError(_ERR_FORMAT_TYPE.format(format_type))
     
-    # Use DayOfWeek enum to get the name
+    # Reason: bound the day to its own row so it cannot index another format's names
     try:
-        return DayOfWeek(model_day).name
-    except ValueError:
-        raise ValueError(f"Invalid day number {day} for format {format_type}")
+        name = _WEEKDAY_NAMES_BY_FORMAT[fmt_id * _NAMES_STRIDE + day] if 0 <= day < _NAMES_STRIDE else None
+    except TypeError:
+        index = _integral_day(day)
+        name = (
+            _WEEKDAY_NAMES_BY_FORMAT[fmt_id * _NAMES_STRIDE + index]
+            if index is not None and 0 <= index < _NAMES_STRIDE else None
+        )
+    
+    if name is None:
+        raise ValueError(_ERR_DAY_FOR_FORMAT.format(day, format_type))
+    
+    return name
+
 
+# Scalar converter and lookup table for each (from_format, to_format) pair
+_SCALAR_CONVERTERS = {
+    (_FMT_MODEL, _FMT_PYTHON): model_to_python_weekday,
+    (_FMT_PYTHON, _FMT_MODEL): python_weekday_to_model,
+    (_FMT_MODEL, _FMT_SUNDAY_FIRST): model_to_sunday_first,
+    (_FMT_SUNDAY_FIRST, _FMT_MODEL): sunday_first_to_model,
+    (_FMT_PYTHON, _FMT_SUNDAY_FIRST): python_weekday_to_sunday_first,
+    (_FMT_SUNDAY_FIRST, _FMT_PYTHON): sunday_first_to_python_weekday,
+}
 
-def convert_weekday_list(days: List[int], from_format: str, to_format: str) -> List[int]:
+# Reason: every format converts through Sunday-first as the canonical form, so
+# any (from, to) pair is two chained gathers over three tables per direction
+# instead of one dedicated table per pair.
+_SF_IDENTITY_LUT = as_lut(tuple(range(7)))
+_TO_SF_LUT = {
+    _FMT_MODEL: as_lut(_MODEL_TO_SF),
+    _FMT_PYTHON: as_lut(_PY_TO_SF),
+    _FMT_SUNDAY_FIRST: _SF_IDENTITY_LUT,
+}
+_FROM_SF_LUT = {
+    _FMT_MODEL: as_lut(_SF_TO_MODEL),
+    _FMT_PYTHON: as_lut(_SF_TO_PY),
+    _FMT_SUNDAY_FIRST: _SF_IDENTITY_LUT,
+}
+
+
+def convert_weekday_list(days: Union[List[int], np.ndarray], from_format: str, to_format: str) -> List[int]:
     """
     Convert a list of weekday numbers from one format to another.
     
     Args:
-        days: List of day numbers in the source format
+        days: List (or 1-D integer array) of day numbers in the source format
         from_format: Source format ("model", "python", or "sunday_first")
         to_format: Target format ("model", "python", or "sunday_first")
         
@@ -280,37 +386,59 @@ def convert_weekday_list(days: List[int], from_format: str, to_format: str) -> L
         [1, 2, 3]
     """
     if from_format == to_format:
-        return days.copy()
+        return days.tolist() if isinstance(days, np.ndarray) else list(days)
     
-    # Define conversion functions based on format combinations
-    conversion_map = {
-        ("model", "python"): model_to_python_weekday,
-        ("python", "model"): python_weekday_to_model,
-        ("model", "sunday_first"): model_to_sunday_first,
-        ("sunday_first", "model"): sunday_first_to_model,
-        ("python", "sunday_first"): python_weekday_to_sunday_first,
-        ("sunday_first", "python"): sunday_first_to_python_weekday,
-    }
+    to_sf = _TO_SF_LUT.get(from_format)
+    from_sf = _FROM_SF_LUT.get(to_format)
+    if to_sf is None or from_sf is None:
+        raise ValueError(_ERR_FORMAT_COMBINATION.format(from_format, to_format))
     
-    key = (from_format, to_format)
-    if key not in conversion_map:
-        raise ValueError(f"Invalid format combination: from '{from_format}' to '{to_format}'")
+    arr = np.asarray(days)
+    if arr.ndim == 1 and arr.dtype.kind in 'iu':
+        converted = gather_weekdays(arr, to_sf, from_sf)
+        if converted is not None:
+            return converted.tolist()
     
-    converter = conversion_map[key]
+    # Invalid or non-integer input: the scalar converter reports the offending day
+    converter = _SCALAR_CONVERTERS[(from_format, to_format)]
     return [converter(day) for day in days]
 
 
+# Reason: dispatch table replaces the per-call format string comparisons; each
+# format maps the Python weekday through its own lookup table.
+_WEEKDAY_FROM_DATE_TABLES = {
+    _FMT_MODEL: _PY_TO_MODEL,
+    _FMT_PYTHON: tuple(range(7)),
+    _FMT_SUNDAY_FIRST: _PY_TO_SF,
+}
+
+# Direct-mapped cache of (ordinal, Python weekday), one entry per slot. The
+# same analysis date is often asked for in several formats; ordinal 0 is never
+# a valid date, so the initial entries can never produce a false hit.
+_WD_CACHE_MASK = 63
+_WD_CACHE = [(0, 0)] * (_WD_CACHE_MASK + 1)
+
+# Reason: call the C implementations on date directly. datetime and pandas
+# Timestamp inherit the same fields, and Timestamp.toordinal() is a much
+# slower Python-level override.
+_DATE_TOORDINAL = _date.toordinal
+_DATE_WEEKDAY = _date.weekday
+
+
 def weekday_from_date(date: datetime, format_type: str = "model") -> int:
     """
     Get the weekday number from a datetime object in the specified format.
     
     Args:
-        date: datetime object
+        date: date, datetime or pandas Timestamp (any datetime.date instance)
         format_type: Output format ("model", "python", or "sunday_first")
         
     Returns:
         Weekday number in the specified format
         
+    Raises:
+        ValueError: If format_type is invalid or date is missing (pd.NaT)
+        
     Examples:
         >>> from datetime import date
         >>> weekday_from_date(date(2025, 7, 15), "model")  # Tuesday
@@ -320,16 +448,24 @@ def weekday_from_date(date: datetime, format_type: str = "model") -> int:
         >>> weekday_from_date(date(2025, 7, 15), "sunday_first")  # Tuesday
         2
     """
-    python_weekday = date.weekday()
+    table = _WEEKDAY_FROM_DATE_TABLES.get(format_type)
+    if table is None:
+        raise ValueError(_ERR_FORMAT_TYPE.format(format_type))
+    
+    # Reason: pd.NaT is a datetime subclass whose C date fields read as day 1
+    # (a Monday), so the unbound calls below would turn it into a real weekday.
+    # NaT is the only date-like value that is not equal to itself.
+    if date != date:
+        raise ValueError(_ERR_MISSING_DATE.format(date))
+    
+    ordinal = _DATE_TOORDINAL(date)
+    slot = ordinal & _WD_CACHE_MASK
+    cached_ordinal, python_weekday = _WD_CACHE[slot]
+    if cached_ordinal != ordinal:
+        python_weekday = _DATE_WEEKDAY(date)
+        _WD_CACHE[slot] = (ordinal, python_weekday)
     
-    if format_type == "python":
-        return python_weekday
-    elif format_type == "model":
-        return python_weekday_to_model(python_weekday)
-    elif format_type == "sunday_first":
-        return python_weekday_to_sunday_first(python_weekday)
-    else:
-        raise ValueError(f"Invalid format_type: {format_type}. Must be 'model', 'python', or 'sunday_first'.")
+    return table[python_weekday]
 
 
 # Weekday names for reference
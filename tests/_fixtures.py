@@ -0,0 +1,61 @@
+"""
+Immutable sample data shared across test modules.
+
+Built once at import so fixtures can return the same objects without
+re-constructing the models for every test. Tests must treat these as read-only.
+"""
+
+import pandas as pd
+
+from src.models.data_models import UnmappedHoursResult, UnmappedCategorySummary
+
+SAMPLE_PERIOD_START = pd.Timestamp('2025-01-01')
+SAMPLE_PERIOD_END = pd.Timestamp('2025-01-02')
+
+# Per-employee unmapped hours for one facility (two categories, three employees)
+UNMAPPED_RESULTS_SAMPLE = (
+    UnmappedHoursResult(
+        facility='Test Facility',
+        category='Unmapped Nursing',
+        employee_name='John Doe',
+        employee_id='EMP001',
+        total_hours=12.0,
+        percentage_of_category=60.0,
+        analysis_period_start=SAMPLE_PERIOD_START,
+        analysis_period_end=SAMPLE_PERIOD_END
+    ),
+    UnmappedHoursResult(
+        facility='Test Facility',
+        category='Unmapped Nursing',
+        employee_name='Jane Smith',
+        employee_id='EMP002',
+        total_hours=8.0,
+        percentage_of_category=40.0,
+        analysis_period_start=SAMPLE_PERIOD_START,
+        analysis_period_end=SAMPLE_PERIOD_END
+    ),
+    UnmappedHoursResult(
+        facility='Test Facility',
+        category='Unmapped Dietary',
+        employee_name='Bob Johnson',
+        employee_id='EMP003',
+        total_hours=6.0,
+        percentage_of_category=100.0,
+        analysis_period_start=SAMPLE_PERIOD_START,
+        analysis_period_end=SAMPLE_PERIOD_END
+    ),
+)
+
+# Category summary matching a single-category display scenario
+UNMAPPED_SUMMARIES_SAMPLE = (
+    UnmappedCategorySummary(
+        facility='Test Facility',
+        category='Unmapped Nursing',
+        total_hours=20.0,
+        employee_count=2,
+        percentage_of_total_unmapped=100.0,
+        average_hours_per_employee=10.0,
+        analysis_period_start=SAMPLE_PERIOD_START,
+        analysis_period_end=SAMPLE_PERIOD_END
+    ),
+)
@@ -0,0 +1,22 @@
+"""
+Small assertion helpers shared across test modules.
+"""
+
+from operator import attrgetter
+from typing import Any, Dict, Iterable
+
+
+def index_results(results: Iterable[Any], *keys: str) -> Dict[Any, Any]:
+    """
+    Index result objects by one or more attributes for O(1) lookups in tests.
+
+    Args:
+        results: Result objects (e.g. UnmappedHoursResult) to index
+        *keys: Attribute names forming the key; a single name keys by its value,
+            several names key by a tuple of values in the given order
+
+    Returns:
+        Dict mapping each key to its result (later duplicates win)
+    """
+    get_key = attrgetter(*keys)
+    return {get_key(result): result for result in results}
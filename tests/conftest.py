@@ -0,0 +1,108 @@
+"""
+Shared pytest fixtures for the workforce analytics test suite.
+"""
+
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+import pytest
+
+# Sample data shipped in examples/, resolved from the repository root
+EXAMPLES_DIR = Path(__file__).resolve().parent.parent / "examples"
+SAMPLE_MODEL_DATA = EXAMPLES_DIR / "SampleModelData.csv"
+SAMPLE_FACILITY_DATA = EXAMPLES_DIR / "SampleFacilityData.csv"
+
+# pytest cache key for the parsed model role list
+MODEL_ROLES_CACHE_KEY = "workforce/model_roles"
+
+# Command-line flag that opts in to the wall-clock perf tests
+RUN_PERF_OPTION = "--run-perf"
+
+
+def pytest_addoption(parser):
+    """Add the opt-in flag for perf-marked tests."""
+    parser.addoption(
+        RUN_PERF_OPTION,
+        action="store_true",
+        default=False,
+        help="run wall-clock performance tests marked with @pytest.mark.perf",
+    )
+
+
+def pytest_configure(config):
+    """Register the perf marker so -m perf and --strict-markers accept it."""
+    config.addinivalue_line(
+        "markers", f"perf: wall-clock performance test, skipped unless {RUN_PERF_OPTION} is given"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip perf-marked tests unless the run opted in.
+
+    Reason: wall-clock budgets depend on the machine and on how many xdist
+    workers share it, so they only run when asked for explicitly.
+    """
+    if config.getoption(RUN_PERF_OPTION):
+        return
+    skip_perf = pytest.mark.skip(reason=f"perf test; pass {RUN_PERF_OPTION} to run")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
+
+@pytest.fixture(scope="session")
+def sample_data_files() -> Dict[str, Path]:
+    """
+    Verify the sample CSV files exist once per session.
+
+    Returns:
+        Dict[str, Path]: Paths keyed by "model" and "facility".
+    """
+    files = {"model": SAMPLE_MODEL_DATA, "facility": SAMPLE_FACILITY_DATA}
+    missing = [str(path) for path in files.values() if not path.exists()]
+    if missing:
+        pytest.skip(f"Sample data files not found: {missing}")
+    return files
+
+
+@pytest.fixture(scope="session")
+def model_data_roles(request, sample_data_files) -> List[str]:
+    """
+    Load the sorted unique model role names once per session.
+
+    The parsed list is also stored in the pytest cache keyed by the CSV's
+    modification time, so later runs skip parsing while the file is unchanged.
+
+    Args:
+        request (pytest.FixtureRequest): Fixture request, used for the cache.
+        sample_data_files (Dict[str, Path]): Verified sample data paths.
+
+    Returns:
+        List[str]: Sorted unique STAFF_ROLE_NAME values from the model data.
+    """
+    model_file = sample_data_files["model"]
+    mtime_ns = model_file.stat().st_mtime_ns
+
+    # The cache is unavailable when pytest runs with -p no:cacheprovider
+    cache = getattr(request.config, "cache", None)
+    if cache is not None:
+        cached = cache.get(MODEL_ROLES_CACHE_KEY, None)
+        if cached and cached.get("mtime_ns") == mtime_ns:
+            return cached["roles"]
+
+    # Reason: read only the role column with a fixed dtype so the C parser skips
+    # type inference on the rest of the file.
+    df = pd.read_csv(
+        model_file,
+        usecols=["STAFF_ROLE_NAME"],
+        dtype={"STAFF_ROLE_NAME": "string"},
+        engine="c",
+        memory_map=True,
+    )
+    roles = sorted(df["STAFF_ROLE_NAME"].unique())
+
+    if cache is not None:
+        cache.set(MODEL_ROLES_CACHE_KEY, {"mtime_ns": mtime_ns, "roles": roles})
+    return roles
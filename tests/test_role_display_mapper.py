@@ -6,7 +6,7 @@ while preserving exact model data role names.
 """
 
 import pytest
-import pandas as pd
+import numpy as np
 from typing import List
 
 from src.utils.role_display_mapper import (
@@ -27,35 +27,41 @@ from src.utils.role_display_mapper import (
     ROLE_DISPLAY_MAPPINGS
 )
 
+# Reason: the mapping table is static, so sort its keys once for every comparison
+SORTED_MAPPED_ROLES = sorted(ROLE_DISPLAY_MAPPINGS.keys())
+
 
 class TestRoleDisplayMappings:
     """Test the core display mapping functionality."""
     
-    def test_all_44_model_roles_have_mappings(self):
+    def test_all_44_model_roles_have_mappings(self, model_data_roles):
         """
         Test that all 44 model data roles have display mappings.
         
         Verifies that every role from the model data has both
         standard and short display name mappings.
         """
-        # Load actual model data to get the complete role list
-        df = pd.read_csv('examples/SampleModelData.csv')
-        actual_model_roles = sorted(df['STAFF_ROLE_NAME'].unique())
+        actual = set(model_data_roles)
         
         # Verify we have exactly 44 roles as expected
-        assert len(actual_model_roles) == 44, f"Expected 44 model roles, found {len(actual_model_roles)}"
-        
-        # Verify all model roles have mappings
-        mapped_roles = sorted(ROLE_DISPLAY_MAPPINGS.keys())
-        assert mapped_roles == actual_model_roles, f"Mapped roles don't match model data roles"
-        
-        # Verify each mapping has both standard and short names
-        for role in actual_model_roles:
-            mapping = ROLE_DISPLAY_MAPPINGS[role]
-            assert "standard" in mapping, f"Role '{role}' missing standard display name"
-            assert "short" in mapping, f"Role '{role}' missing short display name"
-            assert mapping["standard"], f"Role '{role}' has empty standard display name"
-            assert mapping["short"], f"Role '{role}' has empty short display name"
+        assert len(actual) == 44, f"Expected 44 model roles, found {len(actual)}"
+        
+        # Verify all model roles have mappings (sorting is only for the diagnostics)
+        mapped = set(ROLE_DISPLAY_MAPPINGS.keys())
+        assert mapped == actual, f"Mapped roles don't match model data roles: missing={sorted(actual - mapped)}, extra={sorted(mapped - actual)}"
+    
+    @pytest.mark.parametrize("role", SORTED_MAPPED_ROLES)
+    def test_role_has_complete_mapping(self, role):
+        """
+        Test that each mapped role has both standard and short names.
+        
+        Parametrized per role so a failure points at the exact mapping.
+        """
+        mapping = ROLE_DISPLAY_MAPPINGS[role]
+        assert "standard" in mapping, f"Role '{role}' missing standard display name"
+        assert "short" in mapping, f"Role '{role}' missing short display name"
+        assert mapping["standard"], f"Role '{role}' has empty standard display name"
+        assert mapping["short"], f"Role '{role}' has empty short display name"
     
     def test_get_standard_display_name(self):
         """
@@ -213,19 +219,15 @@ class TestRoleDisplayMappings:
 class TestValidationFunctions:
     """Test validation and utility functions."""
     
-    def test_validate_model_roles_coverage_complete(self):
+    def test_validate_model_roles_coverage_complete(self, model_data_roles):
         """
         Test validation with complete model role coverage.
         
         Verifies that validation passes when all model roles
         have display mappings.
         """
-        # Load actual model data
-        df = pd.read_csv('examples/SampleModelData.csv')
-        model_roles = df['STAFF_ROLE_NAME'].unique().tolist()
-        
         # Should pass validation
-        all_covered, missing_roles = validate_model_roles_coverage(model_roles)
+        all_covered, missing_roles = validate_model_roles_coverage(model_data_roles)
         assert all_covered is True
         assert missing_roles == []
     
@@ -391,12 +393,6 @@ class TestConvenienceFunctions:
 class TestModelDataIntegration:
     """Test integration with actual model data."""
     
-    @pytest.fixture
-    def model_data_roles(self):
-        """Load actual model data roles for testing."""
-        df = pd.read_csv('examples/SampleModelData.csv')
-        return sorted(df['STAFF_ROLE_NAME'].unique())
-    
     def test_complete_model_data_coverage(self, model_data_roles):
         """
         Test that all model data roles have display mappings.
@@ -421,8 +417,7 @@ class TestModelDataIntegration:
         Verifies that the mapping keys exactly match the model
         data role names without modification.
         """
-        mapped_roles = sorted(ROLE_DISPLAY_MAPPINGS.keys())
-        assert mapped_roles == model_data_roles, "Mapped roles must exactly match model data roles"
+        assert SORTED_MAPPED_ROLES == model_data_roles, "Mapped roles must exactly match model data roles"
     
     def test_bidirectional_mapping_consistency(self, model_data_roles):
         """
@@ -474,17 +469,24 @@ class TestDisplayNameQuality:
         Verifies that short names are significantly shorter
         than standard names for space-constrained contexts.
         """
-        for model_role, mappings in ROLE_DISPLAY_MAPPINGS.items():
-            standard_name = mappings["standard"]
-            short_name = mappings["short"]
-            
-            # Short names should generally be shorter than standard names
-            # (allowing some exceptions for already short roles)
-            if len(standard_name) > 10:
-                assert len(short_name) < len(standard_name), f"Short name '{short_name}' should be shorter than standard name '{standard_name}'"
-            
-            # Short names should be reasonable length for UI elements
-            assert len(short_name) <= 15, f"Short name '{short_name}' is too long for space-constrained contexts"
+        roles = list(ROLE_DISPLAY_MAPPINGS.keys())
+        standard_lengths = np.fromiter(
+            (len(mappings["standard"]) for mappings in ROLE_DISPLAY_MAPPINGS.values()),
+            dtype=np.int32, count=len(roles)
+        )
+        short_lengths = np.fromiter(
+            (len(mappings["short"]) for mappings in ROLE_DISPLAY_MAPPINGS.values()),
+            dtype=np.int32, count=len(roles)
+        )
+        
+        # Short names should generally be shorter than standard names
+        # (allowing some exceptions for already short roles)
+        not_shorter = np.flatnonzero((standard_lengths > 10) & (short_lengths >= standard_lengths))
+        assert not_shorter.size == 0, f"Short names should be shorter than standard names for roles: {[roles[i] for i in not_shorter]}"
+        
+        # Short names should be reasonable length for UI elements
+        too_long = np.flatnonzero(short_lengths > 15)
+        assert too_long.size == 0, f"Short names too long for space-constrained contexts for roles: {[roles[i] for i in too_long]}"
     
     def test_no_empty_display_names(self):
         """
@@ -492,12 +494,13 @@ class TestDisplayNameQuality:
         
         Verifies data quality of all display mappings.
         """
-        for model_role, mappings in ROLE_DISPLAY_MAPPINGS.items():
-            standard_name = mappings["standard"].strip()
-            short_name = mappings["short"].strip()
-            
-            assert standard_name, f"Empty standard name for role: {model_role}"
-            assert short_name, f"Empty short name for role: {model_role}"
+        empty_standard = [role for role, mappings in ROLE_DISPLAY_MAPPINGS.items()
+                          if not mappings["standard"].strip()]
+        empty_short = [role for role, mappings in ROLE_DISPLAY_MAPPINGS.items()
+                       if not mappings["short"].strip()]
+        
+        assert not empty_standard, f"Empty standard names for roles: {empty_standard}"
+        assert not empty_short, f"Empty short names for roles: {empty_short}"
 
 
 if __name__ == '__main__':
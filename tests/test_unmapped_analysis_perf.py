@@ -0,0 +1,61 @@
+"""
+Scale-up performance regression tests for unmapped hours analysis.
+Guards the aggregation path against per-row (or quadratic) regressions that
+the small hand-built fixtures in test_unmapped_analysis.py cannot reveal.
+Skipped by default; run with: pytest tests/test_unmapped_analysis_perf.py --run-perf
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime
+
+from config.constants import FileColumns
+from src.analysis.unmapped_analysis import analyze_unmapped_hours_for_facility
+
+N_ROWS = 100_000
+N_EMPLOYEES = 500
+ROLES = ['Unmapped Nursing', 'Unmapped Dietary', 'RN', 'CNA', 'Other Unmapped']
+
+# Generous wall-clock budget; the vectorized path runs well under a second
+MAX_SECONDS = 5.0
+
+# Reason: a hard wall-clock limit is flaky on shared CI runners and under
+# xdist, so these tests only run with --run-perf (see conftest.py).
+pytestmark = pytest.mark.perf
+
+
+@pytest.fixture(scope="module")
+def large_facility_data():
+    """Build a 100k-row facility frame with repeated roles and employees."""
+    rng = np.random.default_rng(42)
+    employee_ids = rng.integers(0, N_EMPLOYEES, N_ROWS)
+    return pd.DataFrame({
+        FileColumns.FACILITY_LOCATION_NAME: np.repeat('F', N_ROWS),
+        FileColumns.FACILITY_STAFF_ROLE_NAME: rng.choice(ROLES, N_ROWS),
+        FileColumns.FACILITY_HOURS_DATE: np.repeat(np.datetime64('2025-01-01'), N_ROWS),
+        FileColumns.FACILITY_TOTAL_HOURS: rng.random(N_ROWS) * 8,
+        FileColumns.FACILITY_EMPLOYEE_ID: np.char.add('E', employee_ids.astype(str)),
+        FileColumns.FACILITY_EMPLOYEE_NAME: np.char.add('Name', employee_ids.astype(str)),
+    })
+
+
+def test_analyze_100k_rows_within_budget(large_facility_data):
+    """Test that a 100k-row facility is analyzed within the time budget."""
+    start_date = datetime(2025, 1, 1)
+    end_date = datetime(2025, 1, 1)
+
+    # Reason: pytest-benchmark is not a project dependency, so time a single
+    # run with perf_counter and fail on a clear regression only.
+    started = time.perf_counter()
+    results, summaries = analyze_unmapped_hours_for_facility(
+        large_facility_data, 'F', start_date, end_date
+    )
+    elapsed = time.perf_counter() - started
+
+    # 3 unmapped roles x 500 employees, all present at this sample size
+    assert len(results) == 3 * N_EMPLOYEES
+    assert {summary.category for summary in summaries} == {'Unmapped Nursing', 'Unmapped Dietary', 'Other Unmapped'}
+    assert elapsed < MAX_SECONDS, f"Unmapped analysis of {N_ROWS} rows took {elapsed:.2f}s (budget {MAX_SECONDS}s)"
@@ -5,45 +5,54 @@ Tests the F-0 control variables date calculation functionality.
 
 import pytest
 import pandas as pd
-from datetime import datetime, timedelta
-from unittest.mock import patch
+from datetime import datetime, timedelta, timezone
 
 # Import the modules under test
 from src.utils.date_calculator import (
     calculate_analysis_date_range,
     validate_date_range,
+    to_timestamp,
     _find_most_recent_data_day
 )
 from config.settings import ControlVariables
 from config.constants import FileColumns, DayOfWeek
 
+# Shared read-only control variables, validated once at import. None of the
+# tests mutate them; build a fresh ControlVariables if a test ever needs to.
+_DEFAULT_CTRL = ControlVariables(
+    days_to_drop=7,
+    days_to_process=84,
+    use_data_day=False,
+    new_data_day=1
+)
+_SUNDAY_DATA_DAY_CTRL = ControlVariables(
+    days_to_drop=7,
+    days_to_process=84,
+    use_data_day=True,
+    new_data_day=1  # Sunday
+)
+_ENV_DEFAULT_CTRL = ControlVariables()
+
 
 class TestCalculateAnalysisDateRange:
     """Test the main date calculation function."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_facility_df(self):
-        """Create sample facility dataframe for testing."""
+        """Create sample facility dataframe for testing (read-only, shared per module)."""
         dates = pd.date_range(start='2025-05-01', end='2025-05-31', freq='D')
-        data = []
-        for date in dates:
-            data.append({
-                FileColumns.FACILITY_HOURS_DATE: date,
-                FileColumns.FACILITY_LOCATION_NAME: 'Test Facility',
-                FileColumns.FACILITY_STAFF_ROLE_NAME: 'Nurse',
-                FileColumns.FACILITY_TOTAL_HOURS: 40.0
-            })
-        return pd.DataFrame(data)
+        # Columnar construction; scalar columns are broadcast to the index length
+        return pd.DataFrame({
+            FileColumns.FACILITY_HOURS_DATE: dates,
+            FileColumns.FACILITY_LOCATION_NAME: 'Test Facility',
+            FileColumns.FACILITY_STAFF_ROLE_NAME: 'Nurse',
+            FileColumns.FACILITY_TOTAL_HOURS: 40.0
+        })
     
     @pytest.fixture
     def default_control_variables(self):
-        """Create default control variables for testing."""
-        return ControlVariables(
-            days_to_drop=7,
-            days_to_process=84,
-            use_data_day=False,
-            new_data_day=1
-        )
+        """Default control variables for testing (shared, read-only)."""
+        return _DEFAULT_CTRL
     
     def test_command_line_override_priority(self, sample_facility_df, default_control_variables):
         """Test that command line arguments take highest priority."""
@@ -86,12 +95,7 @@ class TestCalculateAnalysisDateRange:
     def test_dynamic_calculation_with_data_day(self, sample_facility_df):
         """Test dynamic calculation using new_data_day logic (F-0c, F-0d)."""
         # Test: Use data day logic (Sunday = 1)
-        control_vars = ControlVariables(
-            days_to_drop=7,
-            days_to_process=84,
-            use_data_day=True,
-            new_data_day=1  # Sunday
-        )
+        control_vars = _SUNDAY_DATA_DAY_CTRL
         
         start_date, end_date = calculate_analysis_date_range(
             sample_facility_df,
@@ -113,19 +117,18 @@ class TestCalculateAnalysisDateRange:
         # Edge case: Empty dataframe should use current date
         empty_df = pd.DataFrame()
         
-        with patch('src.utils.date_calculator.datetime') as mock_datetime:
-            mock_now = datetime(2025, 7, 14, 12, 0, 0)
-            mock_datetime.now.return_value = mock_now
-            
-            start_date, end_date = calculate_analysis_date_range(
-                empty_df,
-                default_control_variables,
-                None,
-                None
-            )
-            
-            assert start_date == mock_now
-            assert end_date == mock_now
+        mock_now = datetime(2025, 7, 14, 12, 0, 0)
+        
+        start_date, end_date = calculate_analysis_date_range(
+            empty_df,
+            default_control_variables,
+            None,
+            None,
+            now=lambda: mock_now
+        )
+        
+        assert start_date == mock_now
+        assert end_date == mock_now
     
     def test_missing_date_column_handling(self, default_control_variables):
         """Test handling when date column is missing."""
@@ -134,19 +137,18 @@ class TestCalculateAnalysisDateRange:
             'other_column': ['data']
         })
         
-        with patch('src.utils.date_calculator.datetime') as mock_datetime:
-            mock_now = datetime(2025, 7, 14, 12, 0, 0)
-            mock_datetime.now.return_value = mock_now
-            
-            start_date, end_date = calculate_analysis_date_range(
-                df_no_date,
-                default_control_variables,
-                None,
-                None
-            )
-            
-            assert start_date == mock_now
-            assert end_date == mock_now
+        mock_now = datetime(2025, 7, 14, 12, 0, 0)
+        
+        start_date, end_date = calculate_analysis_date_range(
+            df_no_date,
+            default_control_variables,
+            None,
+            None,
+            now=lambda: mock_now
+        )
+        
+        assert start_date == mock_now
+        assert end_date == mock_now
     
     def test_partial_command_line_override(self, sample_facility_df, default_control_variables):
         """Test that both start and end dates must be provided for override."""
@@ -169,9 +171,9 @@ class TestCalculateAnalysisDateRange:
 class TestFindMostRecentDataDay:
     """Test the helper function for finding most recent data day."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def weekly_data(self):
-        """Create data spanning multiple weeks with different days."""
+        """Create data spanning multiple weeks with different days (read-only, shared per module)."""
         dates = [
             datetime(2025, 5, 4),   # Sunday (day 1)
             datetime(2025, 5, 5),   # Monday (day 2) 
@@ -181,13 +183,10 @@ class TestFindMostRecentDataDay:
             datetime(2025, 5, 25),  # Sunday (day 1) - most recent
         ]
         
-        data = []
-        for date in dates:
-            data.append({
-                FileColumns.FACILITY_HOURS_DATE: date,
-                'other_data': 'test'
-            })
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            FileColumns.FACILITY_HOURS_DATE: pd.to_datetime(dates),
+            'other_data': 'test'
+        })
     
     def test_find_most_recent_sunday(self, weekly_data):
         """Test finding most recent Sunday (day 1)."""
@@ -223,80 +222,103 @@ class TestFindMostRecentDataDay:
         # Should fall back to most recent date overall
         expected = datetime(2025, 5, 25)  # Most recent date in data
         assert result == expected
-
-
-class TestValidateDateRange:
-    """Test the date range validation function."""
     
-    def test_valid_date_range(self):
-        """Test validation of valid date range."""
-        start = datetime(2025, 5, 1)
-        end = datetime(2025, 5, 31)
+    def test_find_most_recent_sunday_tz_aware(self):
+        """Test that tz-aware dates are matched on local weekday and keep their time zone."""
+        # 20:00 Chicago is 01:00 UTC the next day, so UTC weekdays are off by one
+        tz_data = pd.DataFrame({
+            FileColumns.FACILITY_HOURS_DATE: pd.date_range(
+                "2025-07-01 20:00", periods=14, freq="D", tz="America/Chicago"
+            )
+        })
         
-        assert validate_date_range(start, end) is True
-    
-    def test_invalid_date_range_same_dates(self):
-        """Test validation fails when start equals end."""
-        date = datetime(2025, 5, 15)
+        result = _find_most_recent_data_day(tz_data, FileColumns.FACILITY_HOURS_DATE, 1)
         
-        assert validate_date_range(date, date) is False
+        assert result == pd.Timestamp("2025-07-13 20:00", tz="America/Chicago")
+        assert str(result.tz) == "America/Chicago"
+
+
+class TestToTimestamp:
+    """Test normalization of date inputs to pd.Timestamp."""
     
-    def test_invalid_date_range_start_after_end(self):
-        """Test validation fails when start is after end."""
-        start = datetime(2025, 5, 31)
-        end = datetime(2025, 5, 1)
-        
-        assert validate_date_range(start, end) is False
+    @pytest.mark.parametrize("value", [
+        datetime(2025, 5, 15),
+        "2025-05-15",
+        pd.Timestamp("2025-05-15"),
+    ])
+    def test_normalizes_supported_inputs(self, value):
+        """Test that datetime, string and Timestamp inputs all normalize."""
+        result = to_timestamp(value)
+        
+        assert isinstance(result, pd.Timestamp)
+        assert result == pd.Timestamp("2025-05-15")
     
-    def test_very_short_date_range(self):
-        """Test validation of very short date range."""
-        start = datetime(2025, 5, 15, 10, 0, 0)
-        end = datetime(2025, 5, 15, 14, 0, 0)  # Same day, different times
+    def test_timestamp_returned_unchanged(self):
+        """Test that an existing Timestamp is passed through as-is."""
+        ts = pd.Timestamp("2025-05-15")
         
-        # Should fail because span is < 1 day
-        assert validate_date_range(start, end) is False
+        assert to_timestamp(ts) is ts
     
-    def test_very_long_date_range(self):
-        """Test validation of very long date range (should warn but pass)."""
-        start = datetime(2024, 1, 1)
-        end = datetime(2025, 6, 1)  # Over 1 year
-        
-        # Should pass but log warning
-        assert validate_date_range(start, end) is True
+    def test_rejects_non_iso_string(self):
+        """Test that strings must use the YYYY-MM-DD override format."""
+        with pytest.raises(ValueError):
+            to_timestamp("05/15/2025")
+
+
+class TestValidateDateRange:
+    """Test the date range validation function."""
     
-    def test_normal_analysis_period(self):
-        """Test validation of typical 84-day analysis period."""
-        start = datetime(2025, 3, 1)
-        end = datetime(2025, 5, 24)  # 84 days
-        
-        assert validate_date_range(start, end) is True
+    @pytest.mark.parametrize("start,end,expected", [
+        pytest.param(datetime(2025, 5, 1), datetime(2025, 5, 31), True, id="valid"),
+        pytest.param(datetime(2025, 5, 15), datetime(2025, 5, 15), False, id="same_dates"),
+        pytest.param(datetime(2025, 5, 31), datetime(2025, 5, 1), False, id="start_after_end"),
+        # Same day, different times: span is < 1 day
+        pytest.param(datetime(2025, 5, 15, 10, 0, 0), datetime(2025, 5, 15, 14, 0, 0), False, id="very_short"),
+        # Over 1 year: passes but logs a warning
+        pytest.param(datetime(2024, 1, 1), datetime(2025, 6, 1), True, id="very_long"),
+        # Typical 84-day analysis period
+        pytest.param(datetime(2025, 3, 1), datetime(2025, 5, 24), True, id="normal_84_days"),
+    ])
+    def test_validate_date_range(self, start, end, expected):
+        """Test validation of valid and invalid date ranges."""
+        assert validate_date_range(start, end) is expected
+    
+    @pytest.mark.parametrize("start,end", [
+        pytest.param(datetime(2025, 5, 1, tzinfo=timezone.utc), datetime(2025, 5, 31), id="aware_start"),
+        pytest.param(datetime(2025, 5, 1), pd.Timestamp("2025-05-31", tz="US/Eastern"), id="aware_end"),
+    ])
+    def test_validate_date_range_rejects_mixed_tz(self, start, end):
+        """Test that mixing a tz-aware and a tz-naive bound raises TypeError."""
+        with pytest.raises(TypeError):
+            validate_date_range(start, end)
 
 
 class TestSundayFirstDayLogic:
     """Test the Sunday=1 day-of-week convention implementation."""
     
-    def test_day_of_week_conversion(self):
+    # This tests the logic in _find_most_recent_data_day
+    @pytest.mark.parametrize("test_date,expected_python_weekday", [
+        (datetime(2025, 5, 4), 6),   # Sunday -> Python weekday 6
+        (datetime(2025, 5, 5), 0),   # Monday -> Python weekday 0
+        (datetime(2025, 5, 6), 1),   # Tuesday -> Python weekday 1
+        (datetime(2025, 5, 10), 5),  # Saturday -> Python weekday 5
+    ])
+    def test_day_of_week_conversion(self, test_date, expected_python_weekday):
         """Test conversion from Sunday=1 to Python weekday convention."""
-        # This tests the logic in _find_most_recent_data_day
-        test_dates = [
-            (datetime(2025, 5, 4), 6),   # Sunday -> Python weekday 6
-            (datetime(2025, 5, 5), 0),   # Monday -> Python weekday 0
-            (datetime(2025, 5, 6), 1),   # Tuesday -> Python weekday 1
-            (datetime(2025, 5, 10), 5),  # Saturday -> Python weekday 5
-        ]
-        
-        for test_date, expected_python_weekday in test_dates:
-            assert test_date.weekday() == expected_python_weekday
+        assert test_date.weekday() == expected_python_weekday
     
-    def test_enum_values_match_upstream(self):
+    @pytest.mark.parametrize("member,value", [
+        (DayOfWeek.SUNDAY, 1),
+        (DayOfWeek.MONDAY, 2),
+        (DayOfWeek.TUESDAY, 3),
+        (DayOfWeek.WEDNESDAY, 4),
+        (DayOfWeek.THURSDAY, 5),
+        (DayOfWeek.FRIDAY, 6),
+        (DayOfWeek.SATURDAY, 7),
+    ])
+    def test_enum_values_match_upstream(self, member, value):
         """Test that DayOfWeek enum matches upstream DAY_NUMBER = 1 for Sunday."""
-        assert DayOfWeek.SUNDAY.value == 1
-        assert DayOfWeek.MONDAY.value == 2
-        assert DayOfWeek.TUESDAY.value == 3
-        assert DayOfWeek.WEDNESDAY.value == 4
-        assert DayOfWeek.THURSDAY.value == 5
-        assert DayOfWeek.FRIDAY.value == 6
-        assert DayOfWeek.SATURDAY.value == 7
+        assert member.value == value
 
 
 # Integration test combining multiple components
@@ -315,12 +337,7 @@ class TestDateCalculatorIntegration:
         })
         
         # Test F-0 variables: use_data_day=True, new_data_day=1 (Sunday)
-        control_vars = ControlVariables(
-            days_to_drop=7,
-            days_to_process=84,
-            use_data_day=True,
-            new_data_day=1
-        )
+        control_vars = _SUNDAY_DATA_DAY_CTRL
         
         start_date, end_date = calculate_analysis_date_range(
             facility_df,
@@ -338,6 +355,26 @@ class TestDateCalculatorIntegration:
         most_recent_date = facility_df[FileColumns.FACILITY_HOURS_DATE].max()
         assert end_date <= most_recent_date
     
+    def test_complete_f0_workflow_with_prebuilt_weekday_column(self):
+        """Test that a precomputed weekday column gives the same period as derived weekdays."""
+        dates = pd.date_range(start='2025-03-01', end='2025-05-31', freq='D')
+        facility_df = pd.DataFrame({
+            FileColumns.FACILITY_HOURS_DATE: dates,
+            FileColumns.FACILITY_TOTAL_HOURS: 40.0
+        })
+        # Python weekday convention (Monday=0), computed once for the frame
+        facility_df['_wd'] = facility_df[FileColumns.FACILITY_HOURS_DATE].dt.weekday
+        
+        control_vars = _SUNDAY_DATA_DAY_CTRL
+        
+        derived = calculate_analysis_date_range(facility_df, control_vars, None, None)
+        prebuilt = calculate_analysis_date_range(
+            facility_df, control_vars, None, None, weekday_col='_wd'
+        )
+        
+        assert prebuilt == derived
+        assert prebuilt[1] == datetime(2025, 5, 25)  # Most recent Sunday
+    
     def test_production_vs_testing_scenarios(self):
         """Test that production and testing scenarios work correctly."""
         # Create test data
@@ -348,7 +385,7 @@ class TestDateCalculatorIntegration:
             FileColumns.FACILITY_TOTAL_HOURS: 40.0
         })
         
-        control_vars = ControlVariables()
+        control_vars = _ENV_DEFAULT_CTRL
         
         # Production scenario: No overrides (dynamic calculation)
         prod_start, prod_end = calculate_analysis_date_range(
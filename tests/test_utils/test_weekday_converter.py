@@ -4,7 +4,11 @@ Unit tests for weekday converter utility module.
 Tests cover all conversion functions with expected use cases, edge cases, and failure scenarios.
 """
 
+import operator
+
 import pytest
+import numpy as np
+import pandas as pd
 from datetime import date, datetime
 from src.utils.weekday_converter import (
     model_to_python_weekday,
@@ -23,16 +27,18 @@ from config.constants import DayOfWeek
 class TestModelToPythonWeekday:
     """Test conversion from model format (Sunday=1) to Python weekday (Monday=0)."""
     
-    def test_model_to_python_expected_use(self):
+    @pytest.mark.parametrize("day,expected", [
+        (1, 6),  # Sunday
+        (2, 0),  # Monday
+        (3, 1),  # Tuesday
+        (4, 2),  # Wednesday
+        (5, 3),  # Thursday
+        (6, 4),  # Friday
+        (7, 5),  # Saturday
+    ])
+    def test_model_to_python_expected_use(self, day, expected):
         """Test expected use cases for model to Python conversion."""
-        # Test all days of the week
-        assert model_to_python_weekday(1) == 6  # Sunday
-        assert model_to_python_weekday(2) == 0  # Monday
-        assert model_to_python_weekday(3) == 1  # Tuesday
-        assert model_to_python_weekday(4) == 2  # Wednesday
-        assert model_to_python_weekday(5) == 3  # Thursday
-        assert model_to_python_weekday(6) == 4  # Friday
-        assert model_to_python_weekday(7) == 5  # Saturday
+        assert model_to_python_weekday(day) == expected
     
     def test_model_to_python_with_enum(self):
         """Test conversion using DayOfWeek enum."""
@@ -40,37 +46,54 @@ class TestModelToPythonWeekday:
         assert model_to_python_weekday(DayOfWeek.MONDAY) == 0
         assert model_to_python_weekday(DayOfWeek.FRIDAY) == 4
     
+    def test_enum_members_index_as_ints(self):
+        """Test that DayOfWeek members are ints usable as table indexes without coercion."""
+        for member in DayOfWeek:
+            assert isinstance(member, int)
+            assert operator.index(member) == member.value
+            assert model_to_python_weekday(member) == model_to_python_weekday(member.value)
+    
     def test_model_to_python_edge_cases(self):
         """Test edge cases (boundary values)."""
         # Test boundary values
         assert model_to_python_weekday(1) == 6  # Minimum valid value
         assert model_to_python_weekday(7) == 5  # Maximum valid value
     
-    def test_model_to_python_failure_cases(self):
+    @pytest.mark.parametrize("day,expected", [(1.0, 6), (np.float64(7.0), 5)])
+    def test_model_to_python_integral_floats(self, day, expected):
+        """Test that integral floats (e.g. from float64 columns) convert like ints."""
+        assert model_to_python_weekday(day) == expected
+    
+    @pytest.mark.parametrize("day", [1.5, float("nan"), float("inf"), 8.0, -1.0, "1"])
+    def test_model_to_python_rejects_non_integral_values(self, day):
+        """Test that non-integral or out-of-range non-int days still raise ValueError."""
+        with pytest.raises(ValueError) as ei:
+            model_to_python_weekday(day)
+        assert "Invalid model day number" in str(ei.value)
+    
+    @pytest.mark.parametrize("day", [0, 8, -1])
+    def test_model_to_python_failure_cases(self, day):
         """Test failure cases with invalid input."""
-        with pytest.raises(ValueError, match="Invalid model day number"):
-            model_to_python_weekday(0)
-        
-        with pytest.raises(ValueError, match="Invalid model day number"):
-            model_to_python_weekday(8)
-        
-        with pytest.raises(ValueError, match="Invalid model day number"):
-            model_to_python_weekday(-1)
+        with pytest.raises(ValueError) as ei:
+            model_to_python_weekday(day)
+        assert "Invalid model day number" in str(ei.value)
 
 
 class TestPythonWeekdayToModel:
     """Test conversion from Python weekday (Monday=0) to model format (Sunday=1)."""
     
-    def test_python_to_model_expected_use(self):
+    @pytest.mark.parametrize("day,expected", [
+        (0, 2),  # Monday
+        (1, 3),  # Tuesday
+        (2, 4),  # Wednesday
+        (3, 5),  # Thursday
+        (4, 6),  # Friday
+        (5, 7),  # Saturday
+        (6, 1),  # Sunday
+    ])
+    def test_python_to_model_expected_use(self, day, expected):
         """Test expected use cases for Python to model conversion."""
-        # Test all days of the week
-        assert python_weekday_to_model(0) == 2  # Monday
-        assert python_weekday_to_model(1) == 3  # Tuesday
-        assert python_weekday_to_model(2) == 4  # Wednesday
-        assert python_weekday_to_model(3) == 5  # Thursday
-        assert python_weekday_to_model(4) == 6  # Friday
-        assert python_weekday_to_model(5) == 7  # Saturday
-        assert python_weekday_to_model(6) == 1  # Sunday
+        assert python_weekday_to_model(day) == expected
     
     def test_python_to_model_edge_cases(self):
         """Test edge cases (boundary values)."""
@@ -78,28 +101,29 @@ class TestPythonWeekdayToModel:
         assert python_weekday_to_model(0) == 2  # Minimum valid value
         assert python_weekday_to_model(6) == 1  # Maximum valid value
     
-    def test_python_to_model_failure_cases(self):
+    @pytest.mark.parametrize("day", [-1, 7])
+    def test_python_to_model_failure_cases(self, day):
         """Test failure cases with invalid input."""
-        with pytest.raises(ValueError, match="Invalid Python weekday number"):
-            python_weekday_to_model(-1)
-        
-        with pytest.raises(ValueError, match="Invalid Python weekday number"):
-            python_weekday_to_model(7)
+        with pytest.raises(ValueError) as ei:
+            python_weekday_to_model(day)
+        assert "Invalid Python weekday number" in str(ei.value)
 
 
 class TestModelToSundayFirst:
     """Test conversion from model format (Sunday=1) to Sunday-first indexing (Sunday=0)."""
     
-    def test_model_to_sunday_first_expected_use(self):
+    @pytest.mark.parametrize("day,expected", [
+        (1, 0),  # Sunday
+        (2, 1),  # Monday
+        (3, 2),  # Tuesday
+        (4, 3),  # Wednesday
+        (5, 4),  # Thursday
+        (6, 5),  # Friday
+        (7, 6),  # Saturday
+    ])
+    def test_model_to_sunday_first_expected_use(self, day, expected):
         """Test expected use cases for model to Sunday-first conversion."""
-        # Test all days of the week
-        assert model_to_sunday_first(1) == 0  # Sunday
-        assert model_to_sunday_first(2) == 1  # Monday
-        assert model_to_sunday_first(3) == 2  # Tuesday
-        assert model_to_sunday_first(4) == 3  # Wednesday
-        assert model_to_sunday_first(5) == 4  # Thursday
-        assert model_to_sunday_first(6) == 5  # Friday
-        assert model_to_sunday_first(7) == 6  # Saturday
+        assert model_to_sunday_first(day) == expected
     
     def test_model_to_sunday_first_with_enum(self):
         """Test conversion using DayOfWeek enum."""
@@ -107,36 +131,36 @@ class TestModelToSundayFirst:
         assert model_to_sunday_first(DayOfWeek.WEDNESDAY) == 3
         assert model_to_sunday_first(DayOfWeek.SATURDAY) == 6
     
-    def test_model_to_sunday_first_failure_cases(self):
+    @pytest.mark.parametrize("day", [0, 8])
+    def test_model_to_sunday_first_failure_cases(self, day):
         """Test failure cases with invalid input."""
-        with pytest.raises(ValueError, match="Invalid model day number"):
-            model_to_sunday_first(0)
-        
-        with pytest.raises(ValueError, match="Invalid model day number"):
-            model_to_sunday_first(8)
+        with pytest.raises(ValueError) as ei:
+            model_to_sunday_first(day)
+        assert "Invalid model day number" in str(ei.value)
 
 
 class TestSundayFirstToModel:
     """Test conversion from Sunday-first indexing (Sunday=0) to model format (Sunday=1)."""
     
-    def test_sunday_first_to_model_expected_use(self):
+    @pytest.mark.parametrize("day,expected", [
+        (0, 1),  # Sunday
+        (1, 2),  # Monday
+        (2, 3),  # Tuesday
+        (3, 4),  # Wednesday
+        (4, 5),  # Thursday
+        (5, 6),  # Friday
+        (6, 7),  # Saturday
+    ])
+    def test_sunday_first_to_model_expected_use(self, day, expected):
         """Test expected use cases for Sunday-first to model conversion."""
-        # Test all days of the week
-        assert sunday_first_to_model(0) == 1  # Sunday
-        assert sunday_first_to_model(1) == 2  # Monday
-        assert sunday_first_to_model(2) == 3  # Tuesday
-        assert sunday_first_to_model(3) == 4  # Wednesday
-        assert sunday_first_to_model(4) == 5  # Thursday
-        assert sunday_first_to_model(5) == 6  # Friday
-        assert sunday_first_to_model(6) == 7  # Saturday
-    
-    def test_sunday_first_to_model_failure_cases(self):
+        assert sunday_first_to_model(day) == expected
+    
+    @pytest.mark.parametrize("day", [-1, 7])
+    def test_sunday_first_to_model_failure_cases(self, day):
         """Test failure cases with invalid input."""
-        with pytest.raises(ValueError, match="Invalid Sunday-first day number"):
-            sunday_first_to_model(-1)
-        
-        with pytest.raises(ValueError, match="Invalid Sunday-first day number"):
-            sunday_first_to_model(7)
+        with pytest.raises(ValueError) as ei:
+            sunday_first_to_model(day)
+        assert "Invalid Sunday-first day number" in str(ei.value)
 
 
 class TestPythonToSundayFirstConversion:
@@ -151,6 +175,16 @@ class TestPythonToSundayFirstConversion:
         """Test expected use cases for Sunday-first to Python conversion."""
         assert sunday_first_to_python_weekday(0) == 6  # Sunday
         assert sunday_first_to_python_weekday(1) == 0  # Monday
+    
+    def test_python_sunday_first_failure_cases(self):
+        """Test that out-of-range days are rejected, including negative indexes."""
+        with pytest.raises(ValueError) as ei:
+            python_weekday_to_sunday_first(-1)
+        assert "Invalid Python weekday number" in str(ei.value)
+        
+        with pytest.raises(ValueError) as ei:
+            sunday_first_to_python_weekday(7)
+        assert "Invalid Sunday-first day number" in str(ei.value)
 
 
 class TestGetWeekdayName:
@@ -176,13 +210,48 @@ class TestGetWeekdayName:
         """Test getting weekday names with DayOfWeek enum."""
         assert get_weekday_name(DayOfWeek.FRIDAY, "model") == "FRIDAY"
     
+    def test_get_weekday_name_integral_floats(self):
+        """Test that integral floats are accepted and non-integral ones rejected."""
+        assert get_weekday_name(1.0) == "SUNDAY"
+        assert get_weekday_name(6.0, "python") == "SUNDAY"
+        
+        with pytest.raises(ValueError) as ei:
+            get_weekday_name(1.5)
+        assert "Invalid day number" in str(ei.value)
+    
     def test_get_weekday_name_failure_cases(self):
         """Test failure cases with invalid format or day."""
-        with pytest.raises(ValueError, match="Invalid format_type"):
+        with pytest.raises(ValueError) as ei:
             get_weekday_name(1, "invalid")
+        assert "Invalid format_type" in str(ei.value)
         
-        with pytest.raises(ValueError, match="Invalid day number"):
+        with pytest.raises(ValueError) as ei:
             get_weekday_name(8, "model")
+        assert "Invalid day number" in str(ei.value)
+        
+        # Out-of-range days must not spill into another format's row
+        with pytest.raises(ValueError) as ei:
+            get_weekday_name(7, "python")
+        assert "Invalid day number" in str(ei.value)
+        
+        with pytest.raises(ValueError) as ei:
+            get_weekday_name(-1, "sunday_first")
+        assert "Invalid day number" in str(ei.value)
+    
+    def test_get_weekday_name_all_formats_agree(self):
+        """Test that every format names the same day for equivalent numbers."""
+        for model_day in range(1, 8):
+            expected = DayOfWeek(model_day).name
+            assert get_weekday_name(model_day, "model") == expected
+            assert get_weekday_name(model_to_python_weekday(model_day), "python") == expected
+            assert get_weekday_name(model_to_sunday_first(model_day), "sunday_first") == expected
+    
+    def test_get_weekday_name_returns_shared_strings(self):
+        """Test that repeated lookups return the same precomputed name object."""
+        for format_type, days in (("model", range(1, 8)), ("python", range(7)), ("sunday_first", range(7))):
+            for day in days:
+                assert get_weekday_name(day, format_type) is get_weekday_name(day, format_type)
+        assert get_weekday_name(DayOfWeek.MONDAY) is get_weekday_name(0, "python")
 
 
 class TestConvertWeekdayList:
@@ -207,30 +276,47 @@ class TestConvertWeekdayList:
     
     def test_convert_weekday_list_failure_cases(self):
         """Test failure cases with invalid formats."""
-        with pytest.raises(ValueError, match="Invalid format combination"):
+        with pytest.raises(ValueError) as ei:
             convert_weekday_list([1, 2], "invalid", "model")
+        assert "Invalid format combination" in str(ei.value)
+        
+        with pytest.raises(ValueError) as ei:
+            convert_weekday_list([1, 8], "model", "python")
+        assert "Invalid model day number" in str(ei.value)
+        
+        with pytest.raises(ValueError) as ei:
+            convert_weekday_list([0, -1], "python", "model")
+        assert "Invalid Python weekday number" in str(ei.value)
+    
+    def test_convert_weekday_list_integral_floats(self):
+        """Test that float lists and float64 arrays of whole days convert."""
+        assert convert_weekday_list([1.0, 2.0], "model", "python") == [6, 0]
+        assert convert_weekday_list(np.array([1.0, 7.0]), "model", "sunday_first") == [0, 6]
+    
+    def test_convert_weekday_list_empty(self):
+        """Test converting an empty list."""
+        assert convert_weekday_list([], "python", "model") == []
 
 
 class TestWeekdayFromDate:
     """Test weekday extraction from datetime objects."""
     
-    def test_weekday_from_date_model_format(self):
+    @pytest.fixture(scope="module")
+    def tuesday(self):
+        """Tuesday, July 15, 2025, shared by the single-date tests."""
+        return date(2025, 7, 15)
+    
+    def test_weekday_from_date_model_format(self, tuesday):
         """Test extracting weekday from date in model format."""
-        # Tuesday, July 15, 2025
-        test_date = date(2025, 7, 15)
-        assert weekday_from_date(test_date, "model") == 3
+        assert weekday_from_date(tuesday, "model") == 3
     
-    def test_weekday_from_date_python_format(self):
+    def test_weekday_from_date_python_format(self, tuesday):
         """Test extracting weekday from date in Python format."""
-        # Tuesday, July 15, 2025
-        test_date = date(2025, 7, 15)
-        assert weekday_from_date(test_date, "python") == 1
+        assert weekday_from_date(tuesday, "python") == 1
     
-    def test_weekday_from_date_sunday_first_format(self):
+    def test_weekday_from_date_sunday_first_format(self, tuesday):
         """Test extracting weekday from date in Sunday-first format."""
-        # Tuesday, July 15, 2025
-        test_date = date(2025, 7, 15)
-        assert weekday_from_date(test_date, "sunday_first") == 2
+        assert weekday_from_date(tuesday, "sunday_first") == 2
     
     def test_weekday_from_date_with_datetime(self):
         """Test extracting weekday from datetime object."""
@@ -240,11 +326,49 @@ class TestWeekdayFromDate:
         assert weekday_from_date(test_datetime, "python") == 6
         assert weekday_from_date(test_datetime, "sunday_first") == 0
     
-    def test_weekday_from_date_failure_cases(self):
+    def test_weekday_from_date_full_week_matches_converters(self):
+        """Test every format over a full week against the scalar converters."""
+        for offset in range(7):
+            test_date = date(2025, 7, 13 + offset)  # Sunday through Saturday
+            python_day = test_date.weekday()
+            assert weekday_from_date(test_date, "python") == python_day
+            assert weekday_from_date(test_date, "model") == python_weekday_to_model(python_day)
+            assert weekday_from_date(test_date, "sunday_first") == python_weekday_to_sunday_first(python_day)
+    
+    def test_weekday_from_date_with_timestamp(self):
+        """Test extracting weekday from a pandas Timestamp (datetime subclass)."""
+        # Sunday, July 13, 2025
+        test_timestamp = pd.Timestamp(2025, 7, 13, 15, 30)
+        assert weekday_from_date(test_timestamp, "model") == 1
+        assert weekday_from_date(test_timestamp, "python") == 6
+        assert weekday_from_date(test_timestamp, "sunday_first") == 0
+    
+    def test_weekday_from_date_timestamp_matches_own_weekday(self):
+        """Test that Timestamps (including tz-aware, near midnight) agree with Timestamp.weekday()."""
+        stamps = pd.date_range("2025-07-13 23:59", periods=7, freq="D", tz="America/Chicago")
+        for stamp in stamps:
+            assert weekday_from_date(stamp, "python") == stamp.weekday()
+            assert weekday_from_date(stamp, "model") == python_weekday_to_model(stamp.weekday())
+    
+    def test_weekday_from_date_cache_slot_collisions(self, tuesday):
+        """Test that dates sharing a weekday cache slot still resolve correctly."""
+        # Ordinals 64 days apart map to the same slot but differ in weekday
+        second = date.fromordinal(tuesday.toordinal() + 64)
+        for test_date in (tuesday, second, tuesday, second):
+            assert weekday_from_date(test_date, "python") == test_date.weekday()
+    
+    @pytest.mark.parametrize("format_type", ["model", "python", "sunday_first"])
+    def test_weekday_from_date_rejects_nat(self, format_type):
+        """Test that a missing date (pd.NaT) raises instead of reading as a Monday."""
+        with pytest.raises(ValueError) as ei:
+            weekday_from_date(pd.NaT, format_type)
+        assert "missing date" in str(ei.value)
+    
+    def test_weekday_from_date_failure_cases(self, tuesday):
         """Test failure cases with invalid format."""
-        test_date = date(2025, 7, 15)
-        with pytest.raises(ValueError, match="Invalid format_type"):
-            weekday_from_date(test_date, "invalid")
+        with pytest.raises(ValueError) as ei:
+            weekday_from_date(tuesday, "invalid")
+        assert "Invalid format_type" in str(ei.value)
 
 
 class TestConversionConsistency:
@@ -252,39 +376,36 @@ class TestConversionConsistency:
     
     def test_model_python_roundtrip(self):
         """Test that model->Python->model conversion is consistent."""
-        for model_day in range(1, 8):
-            python_day = model_to_python_weekday(model_day)
-            back_to_model = python_weekday_to_model(python_day)
-            assert back_to_model == model_day
+        model_days = list(range(1, 8))
+        python_days = convert_weekday_list(model_days, "model", "python")
+        assert convert_weekday_list(python_days, "python", "model") == model_days
     
     def test_model_sunday_first_roundtrip(self):
         """Test that model->Sunday-first->model conversion is consistent."""
-        for model_day in range(1, 8):
-            sunday_first_day = model_to_sunday_first(model_day)
-            back_to_model = sunday_first_to_model(sunday_first_day)
-            assert back_to_model == model_day
+        model_days = list(range(1, 8))
+        sunday_first_days = convert_weekday_list(model_days, "model", "sunday_first")
+        assert convert_weekday_list(sunday_first_days, "sunday_first", "model") == model_days
     
     def test_python_sunday_first_roundtrip(self):
         """Test that Python->Sunday-first->Python conversion is consistent."""
-        for python_day in range(7):
-            sunday_first_day = python_weekday_to_sunday_first(python_day)
-            back_to_python = sunday_first_to_python_weekday(sunday_first_day)
-            assert back_to_python == python_day
+        python_days = list(range(7))
+        sunday_first_days = convert_weekday_list(python_days, "python", "sunday_first")
+        assert convert_weekday_list(sunday_first_days, "sunday_first", "python") == python_days
     
     def test_date_consistency(self):
         """Test that date-based conversions are consistent."""
-        # Test a known date: Tuesday, July 15, 2025
-        test_date = date(2025, 7, 15)
+        # A full week starting on Sunday, July 13, 2025
+        week = [date(2025, 7, 13 + offset) for offset in range(7)]
         
         # Get weekday in all formats
-        model_day = weekday_from_date(test_date, "model")
-        python_day = weekday_from_date(test_date, "python")
-        sunday_first_day = weekday_from_date(test_date, "sunday_first")
+        model_days = [weekday_from_date(d, "model") for d in week]
+        python_days = [weekday_from_date(d, "python") for d in week]
+        sunday_first_days = [weekday_from_date(d, "sunday_first") for d in week]
         
-        # Verify consistency with direct conversions
-        assert model_to_python_weekday(model_day) == python_day
-        assert model_to_sunday_first(model_day) == sunday_first_day
-        assert python_weekday_to_sunday_first(python_day) == sunday_first_day
+        # Verify consistency with the batch conversions
+        assert np.array_equal(convert_weekday_list(model_days, "model", "python"), python_days)
+        assert np.array_equal(convert_weekday_list(model_days, "model", "sunday_first"), sunday_first_days)
+        assert np.array_equal(convert_weekday_list(python_days, "python", "sunday_first"), sunday_first_days)
 
 
 class TestExampleScenarios:
@@ -0,0 +1,133 @@
+"""
+Unit tests for the weekday converter's lookup tables and bulk array conversion.
+
+Tests cover the tuple and int8 lookup tables and the NumPy / numba paths that
+convert_weekday_list takes for integer arrays.
+"""
+
+import pytest
+import numpy as np
+from src.utils.weekday_converter import (
+    model_to_python_weekday,
+    convert_weekday_list,
+    MODEL_TO_PYTHON_WEEKDAY,
+    PYTHON_WEEKDAY_TO_MODEL,
+    MODEL_TO_SUNDAY_FIRST,
+    SUNDAY_FIRST_TO_MODEL,
+    _LUT,
+    _TO_SF_LUT,
+    _FROM_SF_LUT,
+)
+from src.utils._weekday_lookup import NUMBA_MIN_SIZE, gather_through_sunday_first, get_numba_gather
+
+
+class TestConvertWeekdayArrays:
+    """Test batch conversion of NumPy integer arrays."""
+    
+    def test_convert_weekday_list_array_input(self):
+        """Test converting a NumPy array returns a plain list of ints."""
+        result = convert_weekday_list(np.arange(1, 8), "model", "python")
+        assert result == [6, 0, 1, 2, 3, 4, 5]
+        assert all(type(day) is int for day in result)
+    
+    @pytest.mark.parametrize("dtype", [np.int8, np.int16, np.int32, np.int64, np.uint8, np.uint64])
+    def test_convert_weekday_list_array_dtypes(self, dtype):
+        """Test that every integer dtype converts and rejects out-of-range days."""
+        assert convert_weekday_list(np.arange(7, dtype=dtype), "python", "model") == [2, 3, 4, 5, 6, 7, 1]
+        
+        bad = np.array([0, 7], dtype=dtype)
+        if np.issubdtype(dtype, np.signedinteger):
+            bad = np.array([0, -1], dtype=dtype)
+        with pytest.raises(ValueError) as ei:
+            convert_weekday_list(bad, "python", "model")
+        assert "Invalid Python weekday number" in str(ei.value)
+    
+    @pytest.mark.parametrize("dtype", [">i4", "<i4", ">u4", ">i8"])
+    def test_convert_weekday_list_byte_order(self, dtype):
+        """Test that non-native byte order converts and rejects like native arrays."""
+        assert convert_weekday_list(np.array([1, 7], dtype=dtype), "model", "python") == [6, 5]
+        
+        # 16777216 is 1 when its big-endian int32 bytes are misread as little-endian
+        with pytest.raises(ValueError) as ei:
+            convert_weekday_list(np.array([16777216], dtype=dtype), "model", "python")
+        assert "Invalid model day number" in str(ei.value)
+    
+    def test_convert_weekday_list_large_array(self):
+        """Test the bulk path (numba when installed, NumPy otherwise) on a large array."""
+        model_days = np.tile(np.arange(1, 8), NUMBA_MIN_SIZE // 7 + 1)
+        result = convert_weekday_list(model_days, "model", "python")
+        assert result == [model_to_python_weekday(day) for day in model_days.tolist()]
+        
+        model_days[-1] = 0
+        with pytest.raises(ValueError) as ei:
+            convert_weekday_list(model_days, "model", "python")
+        assert "Invalid model day number" in str(ei.value)
+    
+    def test_gather_kernel_matches_numpy_path(self):
+        """Test the (un-jitted) gather kernel used for the numba fast path."""
+        src = np.array([1, 2, 3, 4, 5, 6, 7])
+        out = np.empty(src.size, dtype=np.int8)
+        assert gather_through_sunday_first(src, _TO_SF_LUT["model"], _FROM_SF_LUT["python"], out)
+        assert out.tolist() == convert_weekday_list(src.tolist(), "model", "python")
+        
+        for invalid in (0, 8, -1):
+            bad = np.array([1, invalid])
+            assert not gather_through_sunday_first(bad, _TO_SF_LUT["model"], _FROM_SF_LUT["python"], out)
+    
+    def test_numba_kernel_matches_numpy_path(self):
+        """Test the jitted gather kernel against the NumPy path (needs numba)."""
+        pytest.importorskip("numba")
+        kernel = get_numba_gather()
+        assert kernel is not None
+        
+        src = np.tile(np.arange(1, 8), NUMBA_MIN_SIZE // 7 + 1)
+        out = np.empty(src.size, dtype=np.int8)
+        assert kernel(src, _TO_SF_LUT["model"], _FROM_SF_LUT["python"], out)
+        assert out.tolist() == convert_weekday_list(src.tolist(), "model", "python")
+        
+        src[-1] = 8
+        assert not kernel(src, _TO_SF_LUT["model"], _FROM_SF_LUT["python"], out)
+
+
+class TestLookupTables:
+    """Test that the tuple lookup tables agree with the public mappings."""
+    
+    def test_tables_match_public_mappings(self):
+        """Test each direct table against its mapping dict."""
+        for table, mapping in (
+            (_LUT.model_to_py, MODEL_TO_PYTHON_WEEKDAY),
+            (_LUT.py_to_model, PYTHON_WEEKDAY_TO_MODEL),
+            (_LUT.model_to_sf, MODEL_TO_SUNDAY_FIRST),
+            (_LUT.sf_to_model, SUNDAY_FIRST_TO_MODEL),
+        ):
+            assert {day: table[day] for day in mapping} == mapping
+            assert all(table[day] is None for day in range(len(table)) if day not in mapping)
+    
+    def test_composed_tables_match_chained_mappings(self):
+        """Test the Python <-> Sunday-first tables against the model-format chain."""
+        assert _LUT.py_to_sf == tuple(MODEL_TO_SUNDAY_FIRST[PYTHON_WEEKDAY_TO_MODEL[d]] for d in range(7))
+        assert _LUT.sf_to_py == tuple(MODEL_TO_PYTHON_WEEKDAY[SUNDAY_FIRST_TO_MODEL[d]] for d in range(7))
+    
+    def test_tables_match_closed_form_offsets(self):
+        """Test each table against its branchless offset-and-wrap formula."""
+        for model_day in range(1, 8):
+            assert _LUT.model_to_py[model_day] == model_day - 2 + 7 * (model_day < 2)
+            assert _LUT.model_to_sf[model_day] == model_day - 1
+        for day in range(7):
+            assert _LUT.py_to_model[day] == day + 2 - 7 * (day >= 6)
+            assert _LUT.sf_to_model[day] == day + 1
+            assert _LUT.py_to_sf[day] == day + 1 - 7 * (day >= 6)
+            assert _LUT.sf_to_py[day] == day - 1 + 7 * (day < 1)
+    
+    def test_byte_tables_mirror_tuple_tables(self):
+        """Test that the int8 bulk tables match the tuple tables and are read-only."""
+        for lut, table in (
+            (_TO_SF_LUT["model"], _LUT.model_to_sf),
+            (_TO_SF_LUT["python"], _LUT.py_to_sf),
+            (_FROM_SF_LUT["model"], _LUT.sf_to_model),
+            (_FROM_SF_LUT["python"], _LUT.sf_to_py),
+            (_TO_SF_LUT["sunday_first"], tuple(range(7))),
+        ):
+            assert lut.dtype == np.int8
+            assert lut.tolist() == [-1 if day is None else day for day in table]
+            assert not lut.flags.writeable